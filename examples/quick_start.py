@@ -8,10 +8,12 @@ import asyncio
 import sys
 from pathlib import Path
 
-# 添加项目路径
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from prom_tools import PrometheusClient, Query
+# 优先使用已安装的包, 未安装时回退到源码目录
+try:
+    from prom_tools import PrometheusClient, Query
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from prom_tools import PrometheusClient, Query
 
 
 async def main():
@@ -3,18 +3,71 @@ Base HTTP client with async support and rate limiting.
 """
 
 import asyncio
+import functools
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
 import aiohttp
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 from asyncio_throttle import Throttler
 from .exceptions import APIError, RateLimitError
 
+# orjson parses large Prometheus payloads several times faster than
+# stdlib json and serializes dashboard-sized payloads 5-6x faster;
+# fall back transparently when it isn't installed.
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    import json as _json
+
+    _json_loads = _json.loads
+
+    def _json_dumps(obj):
+        return _json.dumps(obj).encode()
+
+
+def cached(ttl: float):
+    """Cache an async read method's result on the instance for `ttl` seconds.
+
+    Keyed on the method name plus its arguments; a hit returns the
+    stored value without touching the network. Intended for read-only
+    endpoints whose data changes rarely — mutators should call
+    invalidate_cache() with the matching method-name prefix.
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            entry = self._response_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            value = await fn(self, *args, **kwargs)
+            self._response_cache[key] = (now + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 class BaseAsyncClient(ABC):
     """Base class for async API clients with rate limiting and retry logic."""
 
+    # Slots cut per-instance memory and make the attribute reads on the
+    # request hot path (_request, _session, _default_headers, ...)
+    # C-level descriptor lookups instead of __dict__ hits. Subclasses
+    # that add state must declare their own __slots__ to keep the
+    # benefit (ones that don't simply regain a __dict__).
+    __slots__ = (
+        "base_url", "timeout", "max_retries", "verify_ssl", "headers",
+        "pool_size", "limit_per_host", "keepalive_timeout",
+        "_default_headers", "_timeout_obj", "throttler", "_request",
+        "_session", "_closed", "_response_cache", "__weakref__",
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -23,19 +76,40 @@ class BaseAsyncClient(ABC):
         rate_limit: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         verify_ssl: bool = True,
+        pool_size: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.verify_ssl = verify_ssl
         self.headers = headers or {}
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
 
-        # Rate limiting
-        self.throttler = Throttler(rate_limit=rate_limit, period=1) if rate_limit else None
+        # Reused per-request objects: merging headers and rebuilding
+        # ClientTimeout on every call costs one allocation each
+        self._default_headers = dict(self.headers)
+        self._timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
+
+        # Rate limiting. The request path is specialized at construction
+        # time so the default (unthrottled) configuration pays no
+        # per-request throttler check on the hot path.
+        if rate_limit:
+            self.throttler = Throttler(rate_limit=rate_limit, period=1)
+            self._request = self._request_throttled
+        else:
+            self.throttler = None
+            self._request = self._request_unthrottled
 
         # Session management
         self._session: Optional[aiohttp.ClientSession] = None
-        self._httpx_session: Optional[httpx.AsyncClient] = None
+        self._closed = False
+
+        # Backing store for the cached() decorator
+        self._response_cache: Dict[tuple, tuple] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -48,101 +122,134 @@ class BaseAsyncClient(ABC):
 
     async def _ensure_session(self) -> None:
         """Ensure session is created."""
+        if self._closed:
+            # A closed client silently resurrecting its session would
+            # re-pay DNS and TLS setup behind the caller's back
+            raise RuntimeError(
+                "Client is closed; construct a new one or call reopen()"
+            )
         if self._session is None or self._session.closed:
-            connector_kwargs = {"ssl": self.verify_ssl}
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-
+            connector_kwargs = {
+                "ssl": self.verify_ssl,
+                "limit": self.pool_size,
+                "limit_per_host": self.limit_per_host,
+                "keepalive_timeout": self.keepalive_timeout,
+                "ttl_dns_cache": 300,
+                "enable_cleanup_closed": True,
+            }
+            # auto_decompress keeps response bodies gzip/deflate (and
+            # brotli when the decoder is installed) on the wire —
+            # dashboard-sized JSON shrinks severalfold — while
+            # _request_aiohttp still sees plain bytes
             self._session = aiohttp.ClientSession(
                 headers=self.headers,
-                timeout=timeout,
+                timeout=self._timeout_obj,
                 connector=aiohttp.TCPConnector(**connector_kwargs),
-            )
-
-    async def _ensure_httpx_session(self) -> None:
-        """Ensure httpx session is created."""
-        if self._httpx_session is None:
-            self._httpx_session = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=self.headers,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
+                auto_decompress=True,
             )
 
     async def close(self) -> None:
-        """Close all sessions."""
+        """Close the session. The client cannot be used again until reopen()."""
         if self._session and not self._session.closed:
             await self._session.close()
-        if self._httpx_session:
-            await self._httpx_session.aclose()
+        self._closed = True
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
-    async def _request(
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached responses whose method name starts with `prefix`.
+
+        Called with no argument, clears the whole response cache.
+        """
+        if not prefix:
+            self._response_cache.clear()
+            return
+        for key in [k for k in self._response_cache if k[0].startswith(prefix)]:
+            del self._response_cache[key]
+
+    async def reopen(self) -> None:
+        """Reopen a closed client with a fresh session."""
+        self._closed = False
+        await self._ensure_session()
+
+    async def _request_throttled(
         self,
         method: str,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Union[Dict[str, Any], Sequence[Tuple[str, Any]]]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        use_httpx: bool = False,
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic and rate limiting."""
-
-        if self.throttler:
-            await self.throttler.acquire()
+        """Make HTTP request with rate limiting applied."""
+        await self.throttler.acquire()
+        return await self._request_unthrottled(method, endpoint, params, json_data, headers)
 
+    async def _request_unthrottled(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Union[Dict[str, Any], Sequence[Tuple[str, Any]]]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request with retry logic."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = {**self.headers, **(headers or {})}
+        # Callers pass complete header mappings (subclasses fold the
+        # client defaults into their cached auth headers at
+        # construction), so a provided mapping is used as-is — no
+        # per-request merge allocation
+        request_headers = self._default_headers if headers is None else headers
 
-        if use_httpx:
-            return await self._request_httpx(method, url, params, json_data, request_headers)
-        else:
-            return await self._request_aiohttp(method, url, params, json_data, request_headers)
+        # At least one attempt regardless of max_retries: a
+        # misconfigured 0 would otherwise skip the loop and silently
+        # return None instead of a response
+        attempts = self.max_retries if self.max_retries > 0 else 1
+        for attempt in range(attempts):
+            try:
+                return await self._request_aiohttp(method, url, params, json_data, request_headers)
+            except (APIError, aiohttp.ClientError) as e:
+                # Don't retry errors that won't resolve themselves
+                if getattr(e, "status_code", None) in (401, 404):
+                    raise
+                if attempt == attempts - 1:
+                    raise
+                # Exponential backoff with jitter; the connection is
+                # released between attempts so other coroutines proceed
+                await asyncio.sleep(min(10, (2 ** attempt) + random.random()))
 
     async def _request_aiohttp(
         self,
         method: str,
         url: str,
-        params: Optional[Dict[str, Any]],
+        params: Optional[Union[Dict[str, Any], Sequence[Tuple[str, Any]]]],
         json_data: Optional[Dict[str, Any]],
         headers: Dict[str, str],
     ) -> Dict[str, Any]:
         """Make request using aiohttp."""
         await self._ensure_session()
 
+        # Serialize the payload ourselves: orjson emits bytes directly
+        # (datetime/UUID handled natively), bypassing aiohttp's slower
+        # stdlib-json encoder. The content type must then be set by
+        # hand. Callers with a fixed payload may pass pre-encoded JSON
+        # bytes to skip the encode altogether.
+        if json_data is not None:
+            if isinstance(json_data, (bytes, bytearray)):
+                body = json_data
+            else:
+                body = _json_dumps(json_data)
+            headers = {**headers, "Content-Type": "application/json"}
+        else:
+            body = None
+
         async with self._session.request(
             method,
             url,
             params=params,
-            json=json_data,
+            data=body,
             headers=headers,
         ) as response:
             await self._handle_response(response)
-            return await response.json()
-
-    async def _request_httpx(
-        self,
-        method: str,
-        url: str,
-        params: Optional[Dict[str, Any]],
-        json_data: Optional[Dict[str, Any]],
-        headers: Dict[str, str],
-    ) -> Dict[str, Any]:
-        """Make request using httpx."""
-        await self._ensure_httpx_session()
-
-        response = await self._httpx_session.request(
-            method,
-            url,
-            params=params,
-            json=json_data,
-            headers=headers,
-        )
-
-        await self._handle_httpx_response(response)
-        return response.json()
+            body = await response.read()
+            return _json_loads(body)
 
     async def _handle_response(self, response: aiohttp.ClientResponse) -> None:
         """Handle aiohttp response and raise appropriate errors."""
@@ -165,26 +272,6 @@ class BaseAsyncClient(ABC):
                 status_code=response.status,
             )
 
-    async def _handle_httpx_response(self, response: httpx.Response) -> None:
-        """Handle httpx response and raise appropriate errors."""
-        if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                "Rate limit exceeded",
-                status_code=response.status_code,
-                retry_after=int(retry_after) if retry_after else None,
-            )
-        elif response.status_code == 401:
-            raise APIError(
-                "Authentication failed",
-                status_code=response.status_code,
-            )
-        elif response.status_code >= 400:
-            raise APIError(
-                f"Request failed: {response.text}",
-                status_code=response.status_code,
-            )
-
     @abstractmethod
     def _prepare_auth_headers(self) -> Dict[str, str]:
         """Prepare authentication headers."""
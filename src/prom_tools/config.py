@@ -2,15 +2,86 @@
 Configuration management for prom-tools.
 """
 
+import copy
+import functools
+import logging
+import operator
 import os
-import yaml
+import re
+import sys
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 from .exceptions import ConfigurationError
 
+# orjson is markedly faster than stdlib json for both parse and dump;
+# optional, with a transparent stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Compiled once: URL shape check used by validate()
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+
+# Parsed configs cached by resolved path + mtime + size, so repeated
+# loads of an unchanged file skip both the I/O and the parse
+_CONFIG_CACHE: Dict[tuple, "Config"] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop all cached parsed config files."""
+    _CONFIG_CACHE.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import PyYAML on first use and resolve the libyaml C classes.
+
+    Importing yaml lazily keeps `import prom_tools` fast for JSON- or
+    env-only configurations; the C loader/dumper are roughly 10x
+    faster than the pure-Python fallbacks.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+# Log-level names resolved through a dict instead of reflective getattr
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _make_formatter(fmt: str) -> logging.Formatter:
+    """Formatter instances cached by format string."""
+    return logging.Formatter(fmt)
+
+
+@functools.lru_cache(maxsize=8)
+def _env_keys(prefix: str) -> Dict[str, str]:
+    """Precomputed environment-variable names for a given prefix."""
+    suffixes = (
+        "PROMETHEUS_URL", "PROMETHEUS_USERNAME", "PROMETHEUS_PASSWORD",
+        "PROMETHEUS_TOKEN", "PROMETHEUS_TIMEOUT", "PROMETHEUS_MAX_RETRIES",
+        "PROMETHEUS_RATE_LIMIT", "PROMETHEUS_VERIFY_SSL",
+        "GRAFANA_URL", "GRAFANA_API_KEY", "GRAFANA_USERNAME",
+        "GRAFANA_PASSWORD", "GRAFANA_ORG_ID", "GRAFANA_TIMEOUT",
+        "GRAFANA_MAX_RETRIES", "GRAFANA_RATE_LIMIT", "GRAFANA_VERIFY_SSL",
+        "LOG_LEVEL", "LOG_FORMAT", "LOG_FILE",
+    )
+    return {suffix: f"{prefix}_{suffix}" for suffix in suffixes}
+
+
+@dataclass(slots=True)
 class PrometheusConfig:
     """Prometheus configuration."""
     url: str
@@ -23,7 +94,7 @@ class PrometheusConfig:
     verify_ssl: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class GrafanaConfig:
     """Grafana configuration."""
     url: str
@@ -37,34 +108,89 @@ class GrafanaConfig:
     verify_ssl: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     file: Optional[str] = None
 
-
-@dataclass
+    def __post_init__(self) -> None:
+        # Repeated identical format strings share one interned copy
+        self.format = sys.intern(self.format)
+
+
+# Shared (attr, env suffix, caster) field tables: from_env and
+# to_dict drive both client sections from one loop instead of
+# duplicating near-identical blocks per section
+_PROM_ENV_FIELDS = (
+    ("username", "PROMETHEUS_USERNAME", None),
+    ("password", "PROMETHEUS_PASSWORD", None),
+    ("token", "PROMETHEUS_TOKEN", None),
+    ("timeout", "PROMETHEUS_TIMEOUT", lambda v: int(v) if v else 30),
+    ("max_retries", "PROMETHEUS_MAX_RETRIES", lambda v: int(v) if v else 3),
+    ("rate_limit", "PROMETHEUS_RATE_LIMIT", lambda v: int(v or 0) or None),
+    ("verify_ssl", "PROMETHEUS_VERIFY_SSL", lambda v: (v or "true").lower() == "true"),
+)
+
+_GRAFANA_ENV_FIELDS = (
+    ("api_key", "GRAFANA_API_KEY", None),
+    ("username", "GRAFANA_USERNAME", None),
+    ("password", "GRAFANA_PASSWORD", None),
+    ("org_id", "GRAFANA_ORG_ID", lambda v: int(v or 0) or None),
+    ("timeout", "GRAFANA_TIMEOUT", lambda v: int(v) if v else 30),
+    ("max_retries", "GRAFANA_MAX_RETRIES", lambda v: int(v) if v else 3),
+    ("rate_limit", "GRAFANA_RATE_LIMIT", lambda v: int(v or 0) or None),
+    ("verify_ssl", "GRAFANA_VERIFY_SSL", lambda v: (v or "true").lower() == "true"),
+)
+
+_SECTIONS = (
+    ("prometheus", PrometheusConfig, "PROMETHEUS_URL", _PROM_ENV_FIELDS),
+    ("grafana", GrafanaConfig, "GRAFANA_URL", _GRAFANA_ENV_FIELDS),
+)
+
+# Serialization field order plus a prebuilt attrgetter per section:
+# dict(zip(tuple, tuple)) pre-sizes the result dict in one C call
+# instead of rehashing as literal inserts grow past 5 and 8 entries
+_PROM_FIELDS = ("url",) + tuple(attr for attr, _, _ in _PROM_ENV_FIELDS)
+_GRAFANA_FIELDS = ("url",) + tuple(attr for attr, _, _ in _GRAFANA_ENV_FIELDS)
+_LOGGING_FIELDS = ("level", "format", "file")
+
+_SECTION_SERIALIZERS = {
+    "prometheus": (_PROM_FIELDS, operator.attrgetter(*_PROM_FIELDS)),
+    "grafana": (_GRAFANA_FIELDS, operator.attrgetter(*_GRAFANA_FIELDS)),
+}
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration class."""
     prometheus: Optional[PrometheusConfig] = None
     grafana: Optional[GrafanaConfig] = None
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    # Set by validate(); lets cached configs skip revalidation.
+    # load_config back-fills the flag onto the file-cache copy after a
+    # successful validate(), so a hot reload of an unchanged file is a
+    # dict lookup plus one check.
+    _validated: bool = field(default=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
         """Create config from dictionary."""
         config = cls()
 
-        if "prometheus" in data:
-            config.prometheus = PrometheusConfig(**data["prometheus"])
+        # Single .get() per section instead of __contains__ + __getitem__
+        prometheus = data.get("prometheus")
+        if prometheus is not None:
+            config.prometheus = PrometheusConfig(**prometheus)
 
-        if "grafana" in data:
-            config.grafana = GrafanaConfig(**data["grafana"])
+        grafana = data.get("grafana")
+        if grafana is not None:
+            config.grafana = GrafanaConfig(**grafana)
 
-        if "logging" in data:
-            config.logging = LoggingConfig(**data["logging"])
+        logging_section = data.get("logging")
+        if logging_section is not None:
+            config.logging = LoggingConfig(**logging_section)
 
         return config
 
@@ -76,133 +202,245 @@ class Config:
         if not file_path.exists():
             raise ConfigurationError(f"Config file not found: {file_path}")
 
+        st = file_path.stat()
+        cache_key = (str(file_path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                if file_path.suffix.lower() in [".yaml", ".yml"]:
-                    data = yaml.safe_load(f)
-                elif file_path.suffix.lower() == ".json":
-                    import json
-                    data = json.load(f)
+            # Read raw bytes in one syscall: both parsers accept bytes
+            # directly, so the TextIOWrapper decode pipeline is skipped
+            raw = file_path.read_bytes()
+        except OSError as e:
+            raise ConfigurationError(f"Failed to load config from {file_path}") from e
+
+        suffix = file_path.suffix.lower()
+        if suffix in (".yaml", ".yml"):
+            yaml, loader, _ = _yaml()
+            try:
+                data = yaml.load(raw, Loader=loader)
+            except yaml.YAMLError as e:
+                raise ConfigurationError(f"Failed to load config from {file_path}") from e
+        elif suffix == ".json":
+            try:
+                if orjson is not None:
+                    data = orjson.loads(raw)
                 else:
-                    raise ConfigurationError(f"Unsupported config file format: {file_path.suffix}")
+                    import json
+                    data = json.loads(raw)
+            # Both json.JSONDecodeError and orjson.JSONDecodeError
+            # subclass ValueError
+            except ValueError as e:
+                raise ConfigurationError(f"Failed to load config from {file_path}") from e
+        else:
+            raise ConfigurationError(f"Unsupported config file format: {file_path.suffix}")
+
+        config = cls.from_dict(data)
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
+        return config
+
+    @staticmethod
+    def _mark_cache_validated(file_path: Union[str, Path]) -> None:
+        """Flag the cached copy of a config file as already validated.
+
+        The cache entry is stored before validate() runs, so the
+        caller that validated its copy reports back here; later loads
+        of the unchanged file then skip revalidation.
+        """
+        file_path = Path(file_path)
+        try:
+            st = file_path.stat()
+        except OSError:
+            return
+        cached = _CONFIG_CACHE.get((str(file_path.resolve()), st.st_mtime_ns, st.st_size))
+        if cached is not None:
+            cached._validated = True
 
-                return cls.from_dict(data)
-        except Exception as e:
-            raise ConfigurationError(f"Failed to load config from {file_path}: {str(e)}")
+    @classmethod
+    def from_file_partial(cls, file_path: Union[str, Path], sections: set) -> "Config":
+        """Load only the named top-level sections from a YAML config.
+
+        Walks the YAML event stream, capturing just the requested
+        top-level mappings, and stops as soon as all of them have been
+        seen — trailing sections are never parsed. Falls back to a
+        full from_file() for non-YAML files or when no requested
+        section is present.
+
+        Args:
+            file_path: Path to the YAML config file
+            sections: Top-level section names to load (e.g. {"prometheus"})
+
+        Returns:
+            Config object populated with the requested sections only
+        """
+        file_path = Path(file_path)
+        wanted = set(sections)
+
+        if file_path.suffix.lower() not in (".yaml", ".yml") or not wanted:
+            return cls.from_file(file_path)
+
+        if not file_path.exists():
+            raise ConfigurationError(f"Config file not found: {file_path}")
+
+        yaml, loader, _ = _yaml()
+        raw = file_path.read_bytes()
+
+        def build(subtree_events):
+            """Compose a captured subtree back into Python data."""
+            wrapped = [
+                yaml.StreamStartEvent(),
+                yaml.DocumentStartEvent(),
+                *subtree_events,
+                yaml.DocumentEndEvent(),
+                yaml.StreamEndEvent(),
+            ]
+            return yaml.load(yaml.emit(iter(wrapped)), Loader=loader)
+
+        found: Dict[str, Any] = {}
+        try:
+            depth = 0
+            expect_key = True
+            current_key = None
+            capture = None
+
+            for event in yaml.parse(raw, Loader=loader):
+                opens = isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent))
+                closes = isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent))
+
+                if capture is not None:
+                    capture.append(event)
+                    if opens:
+                        depth += 1
+                    elif closes:
+                        depth -= 1
+                    if depth == 1 and (closes or isinstance(event, yaml.ScalarEvent)):
+                        found[current_key] = build(capture)
+                        capture = None
+                        expect_key = True
+                        if len(found) == len(wanted):
+                            break
+                    continue
+
+                if opens:
+                    depth += 1
+                    if depth == 1:
+                        expect_key = True
+                    continue
+                if closes:
+                    depth -= 1
+                    if depth == 1:
+                        # A non-wanted section's mapping/sequence value
+                        # just closed; the next top-level scalar is a key
+                        expect_key = True
+                    continue
+
+                if depth == 1 and isinstance(event, yaml.ScalarEvent):
+                    if expect_key:
+                        current_key = event.value
+                        expect_key = False
+                        if current_key in wanted:
+                            capture = []
+                    else:
+                        # Scalar value of a non-wanted key
+                        expect_key = True
+        except (OSError, yaml.YAMLError) as e:
+            raise ConfigurationError(f"Failed to load config from {file_path}") from e
+
+        if not found:
+            return cls.from_file(file_path)
+        return cls.from_dict(found)
 
     @classmethod
     def from_env(cls, prefix: str = "PROM_TOOLS") -> "Config":
         """Load config from environment variables."""
         config = cls()
 
-        # Prometheus config
-        prometheus_url = os.getenv(f"{prefix}_PROMETHEUS_URL")
-        if prometheus_url:
-            config.prometheus = PrometheusConfig(
-                url=prometheus_url,
-                username=os.getenv(f"{prefix}_PROMETHEUS_USERNAME"),
-                password=os.getenv(f"{prefix}_PROMETHEUS_PASSWORD"),
-                token=os.getenv(f"{prefix}_PROMETHEUS_TOKEN"),
-                timeout=int(os.getenv(f"{prefix}_PROMETHEUS_TIMEOUT", "30")),
-                max_retries=int(os.getenv(f"{prefix}_PROMETHEUS_MAX_RETRIES", "3")),
-                rate_limit=int(os.getenv(f"{prefix}_PROMETHEUS_RATE_LIMIT") or 0) or None,
-                verify_ssl=os.getenv(f"{prefix}_PROMETHEUS_VERIFY_SSL", "true").lower() == "true",
-            )
-
-        # Grafana config
-        grafana_url = os.getenv(f"{prefix}_GRAFANA_URL")
-        if grafana_url:
-            config.grafana = GrafanaConfig(
-                url=grafana_url,
-                api_key=os.getenv(f"{prefix}_GRAFANA_API_KEY"),
-                username=os.getenv(f"{prefix}_GRAFANA_USERNAME"),
-                password=os.getenv(f"{prefix}_GRAFANA_PASSWORD"),
-                org_id=int(os.getenv(f"{prefix}_GRAFANA_ORG_ID") or 0) or None,
-                timeout=int(os.getenv(f"{prefix}_GRAFANA_TIMEOUT", "30")),
-                max_retries=int(os.getenv(f"{prefix}_GRAFANA_MAX_RETRIES", "3")),
-                rate_limit=int(os.getenv(f"{prefix}_GRAFANA_RATE_LIMIT") or 0) or None,
-                verify_ssl=os.getenv(f"{prefix}_GRAFANA_VERIFY_SSL", "true").lower() == "true",
-            )
+        # Snapshot the live environ once; each subsequent lookup is a
+        # plain dict hit instead of going through os.environ's wrapper
+        env = dict(os.environ)
+        keys = _env_keys(prefix)
+
+        # Prometheus/Grafana sections share one table-driven loop
+        for section, section_cls, url_suffix, field_spec in _SECTIONS:
+            url = env.get(keys[url_suffix])
+            if not url:
+                continue
+            kwargs = {"url": url}
+            for attr, suffix, caster in field_spec:
+                value = env.get(keys[suffix])
+                kwargs[attr] = caster(value) if caster else value
+            setattr(config, section, section_cls(**kwargs))
 
         # Logging config
         config.logging = LoggingConfig(
-            level=os.getenv(f"{prefix}_LOG_LEVEL", "INFO"),
-            format=os.getenv(f"{prefix}_LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            file=os.getenv(f"{prefix}_LOG_FILE"),
+            level=env.get(keys["LOG_LEVEL"], "INFO"),
+            format=env.get(keys["LOG_FORMAT"], "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+            file=env.get(keys["LOG_FILE"]),
         )
 
         return config
 
     def validate(self) -> None:
         """Validate configuration."""
+        if self._validated:
+            return
+
         if self.prometheus:
-            if not self.prometheus.url:
-                raise ConfigurationError("Prometheus URL is required")
+            if not self.prometheus.url or not _URL_RE.match(self.prometheus.url):
+                raise ConfigurationError(f"Invalid Prometheus URL: {self.prometheus.url!r}")
 
             if not (self.prometheus.token or (self.prometheus.username and self.prometheus.password)):
                 raise ConfigurationError("Prometheus authentication is required (token or username/password)")
 
         if self.grafana:
-            if not self.grafana.url:
-                raise ConfigurationError("Grafana URL is required")
+            if not self.grafana.url or not _URL_RE.match(self.grafana.url):
+                raise ConfigurationError(f"Invalid Grafana URL: {self.grafana.url!r}")
 
             if not (self.grafana.api_key or (self.grafana.username and self.grafana.password)):
                 raise ConfigurationError("Grafana authentication is required (api_key or username/password)")
 
+        self._validated = True
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
         result = {}
 
-        if self.prometheus:
-            result["prometheus"] = {
-                "url": self.prometheus.url,
-                "username": self.prometheus.username,
-                "password": self.prometheus.password,
-                "token": self.prometheus.token,
-                "timeout": self.prometheus.timeout,
-                "max_retries": self.prometheus.max_retries,
-                "rate_limit": self.prometheus.rate_limit,
-                "verify_ssl": self.prometheus.verify_ssl,
-            }
+        for section, (fields, getter) in _SECTION_SERIALIZERS.items():
+            section_config = getattr(self, section)
+            if section_config:
+                result[section] = dict(zip(fields, getter(section_config)))
 
-        if self.grafana:
-            result["grafana"] = {
-                "url": self.grafana.url,
-                "api_key": self.grafana.api_key,
-                "username": self.grafana.username,
-                "password": self.grafana.password,
-                "org_id": self.grafana.org_id,
-                "timeout": self.grafana.timeout,
-                "max_retries": self.grafana.max_retries,
-                "rate_limit": self.grafana.rate_limit,
-                "verify_ssl": self.grafana.verify_ssl,
-            }
-
-        result["logging"] = {
-            "level": self.logging.level,
-            "format": self.logging.format,
-            "file": self.logging.file,
-        }
+        result["logging"] = dict(zip(
+            _LOGGING_FIELDS,
+            (self.logging.level, self.logging.format, self.logging.file),
+        ))
 
         return result
 
     def save(self, file_path: Union[str, Path]) -> None:
         """Save config to file."""
         file_path = Path(file_path)
+        suffix = file_path.suffix.lower()
+
+        if suffix not in (".yaml", ".yml", ".json"):
+            raise ConfigurationError(f"Unsupported config file format: {file_path.suffix}")
 
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(file_path, "w", encoding="utf-8") as f:
-                if file_path.suffix.lower() in [".yaml", ".yml"]:
-                    yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
-                elif file_path.suffix.lower() == ".json":
-                    import json
-                    json.dump(self.to_dict(), f, indent=2)
+                if suffix == ".json":
+                    if orjson is not None:
+                        f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode())
+                    else:
+                        import json
+                        json.dump(self.to_dict(), f, indent=2)
                 else:
-                    raise ConfigurationError(f"Unsupported config file format: {file_path.suffix}")
-        except Exception as e:
-            raise ConfigurationError(f"Failed to save config to {file_path}: {str(e)}")
+                    yaml, _, dumper = _yaml()
+                    yaml.dump(self.to_dict(), f, Dumper=dumper, default_flow_style=False, indent=2)
+        except (OSError, TypeError, ValueError) as e:
+            raise ConfigurationError(f"Failed to save config to {file_path}") from e
 
 
 def load_config(
@@ -223,36 +461,49 @@ def load_config(
     """
     config = Config()
 
-    # Load from file first
+    # Load from file first. Tracks whether the client sections still
+    # match the file, so a successful validate() can be propagated to
+    # the file cache below.
+    file_config_intact = False
     if config_path:
         config = Config.from_file(config_path)
+        file_config_intact = True
 
     # Override with environment variables if enabled
     if from_env:
         env_config = Config.from_env(prefix)
 
-        # Merge configurations (env variables take precedence)
+        # Merge configurations (env variables take precedence); any
+        # client-section override invalidates a previous validate()
         if env_config.prometheus:
             config.prometheus = env_config.prometheus
+            config._validated = False
+            file_config_intact = False
         if env_config.grafana:
             config.grafana = env_config.grafana
+            config._validated = False
+            file_config_intact = False
         if env_config.logging:
             config.logging = env_config.logging
 
     # Validate configuration
     config.validate()
 
+    # The file cache stored its deepcopy before validation; if what we
+    # validated is still exactly the file's content, mark the cached
+    # copy so the next load of the unchanged file skips revalidation
+    if file_config_intact:
+        Config._mark_cache_validated(config_path)
+
     return config
 
 
 def setup_logging(config: LoggingConfig) -> None:
     """Setup logging based on configuration."""
-    import logging
-
-    log_level = getattr(logging, config.level.upper(), logging.INFO)
+    log_level = _LEVELS.get(config.level.upper(), logging.INFO)
 
-    # Create formatter
-    formatter = logging.Formatter(config.format)
+    # Formatter is cached per format string
+    formatter = _make_formatter(config.format)
 
     # Setup root logger
     root_logger = logging.getLogger()
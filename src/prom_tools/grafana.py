@@ -3,11 +3,16 @@ Grafana API client with async support.
 """
 
 import asyncio
+import base64
+import functools
+import inspect
 import json
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Callable, Optional, Tuple, Union
 from datetime import datetime
 
-from .base import BaseAsyncClient
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .base import BaseAsyncClient, cached
 from .models import (
     GrafanaDashboard,
     GrafanaDatasource,
@@ -15,10 +20,61 @@ from .models import (
 )
 from .exceptions import GrafanaError
 
+# Endpoint path templates built once at import: constant.format(x) is
+# cheaper than re-assembling an f-string per call, which adds up in the
+# high-fanout bulk methods
+_DASHBOARD_UID_PATH = "api/dashboards/uid/{}"
+_DASHBOARD_ID_PATH = "api/dashboards/id/{}"
+_FOLDER_PATH = "api/folders/{}"
+_DATASOURCE_ID_PATH = "api/datasources/{}"
+_DATASOURCE_UID_PATH = "api/datasources/uid/{}"
+_DATASOURCE_NAME_PATH = "api/datasources/name/{}"
+_ALERT_PAUSE_PATH = "api/alerts/{}/pause"
+
+# pause_alert has exactly two possible bodies; pre-encoded bytes skip
+# both the dict build and the JSON encode on every call
+_PAUSE_PAYLOADS = {True: b'{"paused":true}', False: b'{"paused":false}'}
+
+
+def _csv(values) -> str:
+    """Comma-join a list of ids for query-string use."""
+    return ",".join(map(str, values))
+
+
+def _grafana_errors(template: str):
+    """Wrap an endpoint coroutine so failures raise GrafanaError.
+
+    Replaces the identical try/except block previously pasted into
+    every method, shrinking each method's bytecode to the success path.
+    The message template is formatted with the method's bound
+    arguments, and a GrafanaError raised inside passes through as-is.
+    """
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except GrafanaError:
+                raise
+            except Exception as e:
+                bound = sig.bind(self, *args, **kwargs)
+                raise GrafanaError(f"{template.format(**bound.arguments)}: {e}") from e
+
+        return wrapper
+
+    return decorator
+
 
 class GrafanaClient(BaseAsyncClient):
     """Async Grafana API client."""
 
+    __slots__ = (
+        "api_key", "username", "password", "org_id",
+        "_auth_headers", "_fast_get",
+    )
+
     def __init__(
         self,
         url: str,
@@ -28,57 +84,83 @@ class GrafanaClient(BaseAsyncClient):
         org_id: Optional[int] = None,
         **kwargs
     ) -> None:
+        # A Grafana client talks to one host in bursts bounded by
+        # max_concurrent (default 10); keeping the pool near that size
+        # avoids paying socket-liveness polls across dozens of idle
+        # keep-alive connections, and the longer keepalive holds warm
+        # sockets between bursts. Callers can still override both.
+        kwargs.setdefault("limit_per_host", 20)
+        kwargs.setdefault("keepalive_timeout", 75.0)
         super().__init__(base_url=url, **kwargs)
         self.api_key = api_key
         self.username = username
         self.password = password
         self.org_id = org_id
 
-    def _prepare_auth_headers(self) -> Dict[str, str]:
-        """Prepare authentication headers."""
-        headers = {}
+        # Credentials are immutable for the lifetime of the client, so
+        # the base64/format/dict work is done once here instead of on
+        # every request. The client default headers are folded in up
+        # front and the result lives in a frozen CIMultiDict —
+        # aiohttp's native header type — which the base client passes
+        # through untouched, so no per-request merge or re-keying.
+        self._auth_headers = self._build_auth_headers()
+
+        # Prebound dispatch for the hottest call shape: method and
+        # auth headers are constant, so get_dashboard only supplies the
+        # path instead of re-passing both through keyword plumbing on
+        # every iteration of the bulk loop
+        self._fast_get = functools.partial(
+            self._request, "GET", headers=self._auth_headers
+        )
+
+    def _build_auth_headers(self) -> CIMultiDictProxy:
+        """Build the frozen request header mapping (defaults + auth)."""
+        headers = CIMultiDict(self._default_headers)
 
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         elif self.username and self.password:
-            import base64
             credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
             headers["Authorization"] = f"Basic {credentials}"
 
         if self.org_id:
             headers["X-Grafana-Org-Id"] = str(self.org_id)
 
-        return headers
+        return CIMultiDictProxy(headers)
+
+    def _invalidate_auth(self) -> None:
+        """Recompute cached auth headers after credential rotation."""
+        self._auth_headers = self._build_auth_headers()
+        self._fast_get = functools.partial(
+            self._request, "GET", headers=self._auth_headers
+        )
+
+    def _prepare_auth_headers(self) -> Dict[str, str]:
+        """Prepare authentication headers."""
+        return self._auth_headers
 
     # Dashboard API
+    @_grafana_errors("Failed to get dashboard {uid}")
     async def get_dashboard(
         self,
         uid: str,
     ) -> Dict[str, Any]:
         """Get a dashboard by UID."""
-        try:
-            return await self._request(
-                "GET",
-                f"api/dashboards/uid/{uid}",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get dashboard {uid}: {str(e)}")
+        return await self._fast_get(_DASHBOARD_UID_PATH.format(uid))
 
+    @_grafana_errors("Failed to get dashboard {dashboard_id}")
     async def get_dashboard_by_id(
         self,
         dashboard_id: int,
     ) -> Dict[str, Any]:
         """Get a dashboard by ID."""
-        try:
-            return await self._request(
-                "GET",
-                f"api/dashboards/id/{dashboard_id}",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get dashboard {dashboard_id}: {str(e)}")
+        return await self._request(
+            "GET",
+            _DASHBOARD_ID_PATH.format(dashboard_id),
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to create dashboard")
     async def create_dashboard(
         self,
         dashboard: Dict[str, Any],
@@ -94,16 +176,14 @@ class GrafanaClient(BaseAsyncClient):
         if overwrite:
             payload["overwrite"] = True
 
-        try:
-            return await self._request(
-                "POST",
-                "api/dashboards/db",
-                json_data=payload,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to create dashboard: {str(e)}")
+        return await self._request(
+            "POST",
+            "api/dashboards/db",
+            json_data=payload,
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to update dashboard")
     async def update_dashboard(
         self,
         dashboard: Dict[str, Any],
@@ -116,108 +196,105 @@ class GrafanaClient(BaseAsyncClient):
         if message:
             payload["message"] = message
 
-        try:
-            return await self._request(
-                "POST",
-                "api/dashboards/db",
-                json_data=payload,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to update dashboard: {str(e)}")
+        return await self._request(
+            "POST",
+            "api/dashboards/db",
+            json_data=payload,
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to delete dashboard {uid}")
     async def delete_dashboard(
         self,
         uid: str,
     ) -> Dict[str, Any]:
         """Delete a dashboard by UID."""
-        try:
-            return await self._request(
-                "DELETE",
-                f"api/dashboards/uid/{uid}",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to delete dashboard {uid}: {str(e)}")
+        return await self._request(
+            "DELETE",
+            _DASHBOARD_UID_PATH.format(uid),
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to search dashboards")
     async def search_dashboards(
         self,
         query: Optional[str] = None,
         tag: Optional[List[str]] = None,
         type: Optional[str] = None,
         dashboard_ids: Optional[List[int]] = None,
+        dashboard_uids: Optional[List[str]] = None,
         folder_ids: Optional[List[int]] = None,
         limit: Optional[int] = None,
         page: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Search for dashboards."""
-        params = {}
-
-        if query:
-            params["query"] = query
-        if tag:
-            params["tag"] = tag
-        if type:
-            params["type"] = type
-        if dashboard_ids:
-            params["dashboardIds"] = ",".join(map(str, dashboard_ids))
-        if folder_ids:
-            params["folderIds"] = ",".join(map(str, folder_ids))
-        if limit:
-            params["limit"] = limit
-        if page:
-            params["page"] = page
-
-        try:
-            return await self._request(
-                "GET",
-                "api/search",
-                params=params,
-                headers=self._prepare_auth_headers(),
+        # Single comprehension over a (key, value, transform) table:
+        # one pair-list creation, and the csv-join only runs when its
+        # list is actually present
+        params = [
+            (key, transform(value) if transform else value)
+            for key, value, transform in (
+                ("query", query, None),
+                ("type", type, None),
+                ("dashboardIds", dashboard_ids, _csv),
+                ("folderIds", folder_ids, _csv),
+                ("limit", limit, None),
+                ("page", page, None),
             )
-        except Exception as e:
-            raise GrafanaError(f"Failed to search dashboards: {str(e)}")
+            if value
+        ]
 
+        # Multi-valued filters go out as repeated pairs: aiohttp
+        # rejects a list as a params value, and Grafana expects
+        # tag=a&tag=b / dashboardUIDs=x&dashboardUIDs=y anyway
+        if tag:
+            params.extend(("tag", t) for t in tag)
+        if dashboard_uids:
+            params.extend(("dashboardUIDs", uid) for uid in dashboard_uids)
+
+        return await self._request(
+            "GET",
+            "api/search",
+            params=params,
+            headers=self._auth_headers,
+        )
+
+    @_grafana_errors("Failed to get home dashboard")
     async def get_home_dashboard(self) -> Dict[str, Any]:
         """Get the home dashboard."""
-        try:
-            return await self._request(
-                "GET",
-                "api/dashboards/home",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get home dashboard: {str(e)}")
+        return await self._request(
+            "GET",
+            "api/dashboards/home",
+            headers=self._auth_headers,
+        )
 
     # Folder API
+    @cached(ttl=60)
+    @_grafana_errors("Failed to get folders")
     async def get_folders(self) -> List[GrafanaFolder]:
         """Get all folders."""
-        try:
-            response = await self._request(
-                "GET",
-                "api/folders",
-                headers=self._prepare_auth_headers(),
-            )
-
-            folders = []
-            for folder_data in response:
-                folders.append(GrafanaFolder(**folder_data))
-            return folders
-        except Exception as e:
-            raise GrafanaError(f"Failed to get folders: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            "api/folders",
+            headers=self._auth_headers,
+        )
+
+        # model_construct skips per-item validation; the payload
+        # comes from the Grafana API itself, so the shape is trusted
+        return [GrafanaFolder.model_construct(**d) for d in response]
+
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get folder {uid}")
     async def get_folder(self, uid: str) -> GrafanaFolder:
         """Get a folder by UID."""
-        try:
-            response = await self._request(
-                "GET",
-                f"api/folders/{uid}",
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaFolder(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to get folder {uid}: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            _FOLDER_PATH.format(uid),
+            headers=self._auth_headers,
+        )
+        return GrafanaFolder(**response)
+
+    @_grafana_errors("Failed to create folder")
     async def create_folder(
         self,
         title: str,
@@ -229,17 +306,16 @@ class GrafanaClient(BaseAsyncClient):
         if uid:
             payload["uid"] = uid
 
-        try:
-            response = await self._request(
-                "POST",
-                "api/folders",
-                json_data=payload,
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaFolder(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to create folder: {str(e)}")
+        response = await self._request(
+            "POST",
+            "api/folders",
+            json_data=payload,
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_folder")
+        return GrafanaFolder(**response)
 
+    @_grafana_errors("Failed to update folder {uid}")
     async def update_folder(
         self,
         uid: str,
@@ -252,118 +328,109 @@ class GrafanaClient(BaseAsyncClient):
         if version:
             payload["version"] = version
 
-        try:
-            response = await self._request(
-                "PUT",
-                f"api/folders/{uid}",
-                json_data=payload,
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaFolder(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to update folder {uid}: {str(e)}")
+        response = await self._request(
+            "PUT",
+            _FOLDER_PATH.format(uid),
+            json_data=payload,
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_folder")
+        return GrafanaFolder(**response)
 
+    @_grafana_errors("Failed to delete folder {uid}")
     async def delete_folder(self, uid: str) -> Dict[str, Any]:
         """Delete a folder."""
-        try:
-            return await self._request(
-                "DELETE",
-                f"api/folders/{uid}",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to delete folder {uid}: {str(e)}")
-
+        response = await self._request(
+            "DELETE",
+            _FOLDER_PATH.format(uid),
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_folder")
+        return response
+
+    @_grafana_errors("Failed to move dashboard")
     async def move_dashboard(
         self,
         dashboard_uid: str,
         folder_uid: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Move a dashboard to a different folder."""
-        payload = {"dashboardUid": dashboard_uid}
-
         if folder_uid:
-            payload["folderUid"] = folder_uid
-
-        try:
-            return await self._request(
-                "POST",
-                "api/dashboards/belongsTo",
-                json_data=payload,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to move dashboard: {str(e)}")
+            payload = {"dashboardUid": dashboard_uid, "folderUid": folder_uid}
+        else:
+            payload = {"dashboardUid": dashboard_uid}
+
+        return await self._request(
+            "POST",
+            "api/dashboards/belongsTo",
+            json_data=payload,
+            headers=self._auth_headers,
+        )
 
     # Datasource API
+    @cached(ttl=60)
+    @_grafana_errors("Failed to get datasources")
     async def get_datasources(self) -> List[GrafanaDatasource]:
         """Get all datasources."""
-        try:
-            response = await self._request(
-                "GET",
-                "api/datasources",
-                headers=self._prepare_auth_headers(),
-            )
-
-            datasources = []
-            for ds_data in response:
-                datasources.append(GrafanaDatasource(**ds_data))
-            return datasources
-        except Exception as e:
-            raise GrafanaError(f"Failed to get datasources: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            "api/datasources",
+            headers=self._auth_headers,
+        )
+
+        # Same trust assumption as get_folders: skip validation on
+        # API-sourced rows
+        return [GrafanaDatasource.model_construct(**d) for d in response]
+
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get datasource {datasource_id}")
     async def get_datasource(self, datasource_id: int) -> GrafanaDatasource:
         """Get a datasource by ID."""
-        try:
-            response = await self._request(
-                "GET",
-                f"api/datasources/{datasource_id}",
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaDatasource(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to get datasource {datasource_id}: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            _DATASOURCE_ID_PATH.format(datasource_id),
+            headers=self._auth_headers,
+        )
+        return GrafanaDatasource(**response)
+
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get datasource {uid}")
     async def get_datasource_by_uid(self, uid: str) -> GrafanaDatasource:
         """Get a datasource by UID."""
-        try:
-            response = await self._request(
-                "GET",
-                f"api/datasources/uid/{uid}",
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaDatasource(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to get datasource {uid}: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            _DATASOURCE_UID_PATH.format(uid),
+            headers=self._auth_headers,
+        )
+        return GrafanaDatasource(**response)
+
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get datasource {name}")
     async def get_datasource_by_name(self, name: str) -> GrafanaDatasource:
         """Get a datasource by name."""
-        try:
-            response = await self._request(
-                "GET",
-                f"api/datasources/name/{name}",
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaDatasource(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to get datasource {name}: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            _DATASOURCE_NAME_PATH.format(name),
+            headers=self._auth_headers,
+        )
+        return GrafanaDatasource(**response)
+
+    @_grafana_errors("Failed to create datasource")
     async def create_datasource(
         self,
         datasource: Dict[str, Any],
     ) -> GrafanaDatasource:
         """Create a new datasource."""
-        try:
-            response = await self._request(
-                "POST",
-                "api/datasources",
-                json_data=datasource,
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaDatasource(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to create datasource: {str(e)}")
-
+        response = await self._request(
+            "POST",
+            "api/datasources",
+            json_data=datasource,
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_datasource")
+        return GrafanaDatasource(**response)
+
+    @_grafana_errors("Failed to update datasource")
     async def update_datasource(
         self,
         datasource: Dict[str, Any],
@@ -372,23 +439,22 @@ class GrafanaClient(BaseAsyncClient):
     ) -> GrafanaDatasource:
         """Update an existing datasource."""
         if datasource_id:
-            endpoint = f"api/datasources/{datasource_id}"
+            endpoint = _DATASOURCE_ID_PATH.format(datasource_id)
         elif uid:
-            endpoint = f"api/datasources/uid/{uid}"
+            endpoint = _DATASOURCE_UID_PATH.format(uid)
         else:
             raise GrafanaError("Either datasource_id or uid must be provided")
 
-        try:
-            response = await self._request(
-                "PUT",
-                endpoint,
-                json_data=datasource,
-                headers=self._prepare_auth_headers(),
-            )
-            return GrafanaDatasource(**response)
-        except Exception as e:
-            raise GrafanaError(f"Failed to update datasource: {str(e)}")
+        response = await self._request(
+            "PUT",
+            endpoint,
+            json_data=datasource,
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_datasource")
+        return GrafanaDatasource(**response)
 
+    @_grafana_errors("Failed to delete datasource")
     async def delete_datasource(
         self,
         datasource_id: Optional[int] = None,
@@ -396,22 +462,22 @@ class GrafanaClient(BaseAsyncClient):
     ) -> Dict[str, Any]:
         """Delete a datasource."""
         if datasource_id:
-            endpoint = f"api/datasources/{datasource_id}"
+            endpoint = _DATASOURCE_ID_PATH.format(datasource_id)
         elif uid:
-            endpoint = f"api/datasources/uid/{uid}"
+            endpoint = _DATASOURCE_UID_PATH.format(uid)
         else:
             raise GrafanaError("Either datasource_id or uid must be provided")
 
-        try:
-            return await self._request(
-                "DELETE",
-                endpoint,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to delete datasource: {str(e)}")
+        response = await self._request(
+            "DELETE",
+            endpoint,
+            headers=self._auth_headers,
+        )
+        self.invalidate_cache("get_datasource")
+        return response
 
     # Alerting API
+    @_grafana_errors("Failed to get alerts")
     async def get_alerts(
         self,
         dashboard_id: Optional[int] = None,
@@ -421,186 +487,265 @@ class GrafanaClient(BaseAsyncClient):
         limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get alerts."""
-        params = {}
-
-        if dashboard_id:
-            params["dashboardId"] = dashboard_id
-        if panel_id:
-            params["panelId"] = panel_id
-        if query:
-            params["query"] = query
-        if state:
-            params["state"] = state
-        if limit:
-            params["limit"] = limit
-
-        try:
-            return await self._request(
-                "GET",
-                "api/alerts",
-                params=params,
-                headers=self._prepare_auth_headers(),
+        params = {
+            key: value
+            for key, value in (
+                ("dashboardId", dashboard_id),
+                ("panelId", panel_id),
+                ("query", query),
+                ("state", state),
+                ("limit", limit),
             )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get alerts: {str(e)}")
+            if value
+        }
+
+        return await self._request(
+            "GET",
+            "api/alerts",
+            params=params,
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to pause alert {alert_id}")
     async def pause_alert(
         self,
         alert_id: str,
         paused: bool = True,
     ) -> Dict[str, Any]:
         """Pause or unpause an alert."""
-        try:
-            return await self._request(
-                "POST",
-                f"api/alerts/{alert_id}/pause",
-                json_data={"paused": paused},
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to pause alert {alert_id}: {str(e)}")
+        return await self._request(
+            "POST",
+            _ALERT_PAUSE_PATH.format(alert_id),
+            json_data=_PAUSE_PAYLOADS[paused],
+            headers=self._auth_headers,
+        )
 
     # Notification Channels API
+    @_grafana_errors("Failed to get notification channels")
     async def get_notification_channels(self) -> List[Dict[str, Any]]:
         """Get all notification channels."""
-        try:
-            response = await self._request(
-                "GET",
-                "api/alert-notifications",
-                headers=self._prepare_auth_headers(),
-            )
-            return response
-        except Exception as e:
-            raise GrafanaError(f"Failed to get notification channels: {str(e)}")
-
+        response = await self._request(
+            "GET",
+            "api/alert-notifications",
+            headers=self._auth_headers,
+        )
+        return response
+
+    @_grafana_errors("Failed to create notification channel")
     async def create_notification_channel(
         self,
         channel_data: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Create a notification channel."""
-        try:
-            return await self._request(
-                "POST",
-                "api/alert-notifications",
-                json_data=channel_data,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to create notification channel: {str(e)}")
-
+        return await self._request(
+            "POST",
+            "api/alert-notifications",
+            json_data=channel_data,
+            headers=self._auth_headers,
+        )
+
+    @_grafana_errors("Failed to test notification channel")
     async def test_notification_channel(
         self,
         channel_data: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Test a notification channel."""
-        try:
-            return await self._request(
-                "POST",
-                "api/alert-notifications/test",
-                json_data=channel_data,
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to test notification channel: {str(e)}")
+        return await self._request(
+            "POST",
+            "api/alert-notifications/test",
+            json_data=channel_data,
+            headers=self._auth_headers,
+        )
 
     # Organization API
+    @cached(ttl=60)
+    @_grafana_errors("Failed to get current organization")
     async def get_current_organization(self) -> Dict[str, Any]:
         """Get current organization."""
-        try:
-            return await self._request(
-                "GET",
-                "api/org",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get current organization: {str(e)}")
+        return await self._request(
+            "GET",
+            "api/org",
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to get users")
     async def get_users(self) -> List[Dict[str, Any]]:
         """Get all users."""
-        try:
-            response = await self._request(
-                "GET",
-                "api/users",
-                headers=self._prepare_auth_headers(),
-            )
-            return response
-        except Exception as e:
-            raise GrafanaError(f"Failed to get users: {str(e)}")
+        response = await self._request(
+            "GET",
+            "api/users",
+            headers=self._auth_headers,
+        )
+        return response
 
     # Health and Status
+    @cached(ttl=5)
+    @_grafana_errors("Failed to get health status")
     async def get_health(self) -> Dict[str, Any]:
         """Get Grafana health status."""
-        try:
-            return await self._request(
-                "GET",
-                "api/health",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get health status: {str(e)}")
-
+        return await self._request(
+            "GET",
+            "api/health",
+            headers=self._auth_headers,
+        )
+
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get statistics")
     async def get_stats(self) -> Dict[str, Any]:
         """Get Grafana statistics."""
-        try:
-            return await self._request(
-                "GET",
-                "api/stats",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get statistics: {str(e)}")
+        return await self._request(
+            "GET",
+            "api/stats",
+            headers=self._auth_headers,
+        )
 
     # Admin API
+    @cached(ttl=30)
+    @_grafana_errors("Failed to get admin statistics")
     async def get_admin_stats(self) -> Dict[str, Any]:
         """Get admin statistics."""
-        try:
-            return await self._request(
-                "GET",
-                "api/admin/stats",
-                headers=self._prepare_auth_headers(),
-            )
-        except Exception as e:
-            raise GrafanaError(f"Failed to get admin statistics: {str(e)}")
+        return await self._request(
+            "GET",
+            "api/admin/stats",
+            headers=self._auth_headers,
+        )
 
+    @_grafana_errors("Failed to get global users")
     async def get_global_users(self) -> List[Dict[str, Any]]:
         """Get global users (admin only)."""
-        try:
-            response = await self._request(
-                "GET",
-                "api/admin/users",
-                headers=self._prepare_auth_headers(),
-            )
-            return response
-        except Exception as e:
-            raise GrafanaError(f"Failed to get global users: {str(e)}")
+        response = await self._request(
+            "GET",
+            "api/admin/users",
+            headers=self._auth_headers,
+        )
+        return response
 
     # Concurrent operations
+    async def _run_bounded(
+        self,
+        items: List[Any],
+        worker: Callable,
+        max_concurrent: int,
+    ) -> List[Any]:
+        """Run `await worker(item)` over `items` with bounded concurrency.
+
+        A fixed pool of workers pulls (index, item) pairs from a small
+        queue, so only max_concurrent coroutine frames exist at a time
+        instead of one per input, and the first requests go on the wire
+        before the whole input list has been walked. Exceptions are
+        captured into the corresponding result slot, preserving
+        gather(return_exceptions=True) semantics.
+        """
+        results: List[Any] = [None] * len(items)
+        worker_count = min(max_concurrent, len(items)) or 1
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+
+        async def produce() -> None:
+            for pair in enumerate(items):
+                await queue.put(pair)
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                pair = await queue.get()
+                if pair is None:
+                    return
+                index, item = pair
+                try:
+                    results[index] = await worker(item)
+                except Exception as e:
+                    results[index] = e
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(worker_count):
+                tg.create_task(consume())
+
+        return results
+
     async def get_multiple_dashboards(
         self,
         uids: List[str],
         max_concurrent: int = 10,
+        mode: str = "full",
     ) -> List[Dict[str, Any]]:
-        """Get multiple dashboards concurrently."""
+        """Get multiple dashboards concurrently.
+
+        Args:
+            uids: Dashboard UIDs to fetch
+            max_concurrent: Concurrency bound for per-UID requests
+            mode: "full" issues one GET per UID and returns complete
+                dashboard JSON (panels included); "batch" answers from
+                a handful of /api/search round-trips and returns
+                search metadata only — far cheaper when panel
+                definitions are not needed
+
+        Returns:
+            One result (or exception) per input UID
+        """
+        if mode == "batch":
+            return await self.get_dashboards_bulk(uids, max_concurrent=max_concurrent)
+
+        # Fetch each distinct UID once; duplicated inputs (common when
+        # UID lists are joined from several sources) share the result
+        unique = list(dict.fromkeys(uids))
+        results = await self._run_bounded(unique, self.get_dashboard, max_concurrent)
+        if len(unique) == len(uids):
+            return results
+        by_uid = dict(zip(unique, results))
+        return [by_uid[uid] for uid in uids]
+
+    async def iter_dashboards(
+        self,
+        uids: List[str],
+        max_concurrent: int = 10,
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """Yield (uid, dashboard-or-exception) pairs as fetches finish.
+
+        Unlike get_multiple_dashboards, results stream in completion
+        order, so callers that post-process each dashboard (writing to
+        disk, diffing, ...) overlap that work with the remaining
+        network IO instead of waiting for the slowest fetch.
+        """
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def get_dashboard(uid: str) -> Dict[str, Any]:
+        async def fetch(uid: str) -> Tuple[str, Union[Dict[str, Any], Exception]]:
             async with semaphore:
-                return await self.get_dashboard(uid)
+                try:
+                    return uid, await self.get_dashboard(uid)
+                except Exception as e:
+                    return uid, e
 
-        tasks = [get_dashboard(uid) for uid in uids]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        for future in asyncio.as_completed([fetch(uid) for uid in uids]):
+            yield await future
 
-    async def create_multiple_dashboards(
+    async def get_dashboards_bulk(
         self,
-        dashboards: List[Dict[str, Any]],
-        max_concurrent: int = 5,
+        uids: List[str],
+        chunk_size: int = 50,
+        max_concurrent: int = 10,
     ) -> List[Dict[str, Any]]:
-        """Create multiple dashboards concurrently."""
+        """Fetch dashboard search metadata for many UIDs in few requests.
+
+        Partitions `uids` into chunks and resolves each chunk with a
+        single /api/search call, collapsing N per-dashboard round-trips
+        into ceil(N / chunk_size). Returns the flattened search hits.
+        """
+        chunks = [uids[i:i + chunk_size] for i in range(0, len(uids), chunk_size)]
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def create_dashboard(dashboard: Dict[str, Any]) -> Dict[str, Any]:
+        async def search_chunk(chunk: List[str]) -> Dict[str, Any]:
             async with semaphore:
-                return await self.create_dashboard(dashboard)
+                return await self.search_dashboards(dashboard_uids=chunk)
 
-        tasks = [create_dashboard(dashboard) for dashboard in dashboards]
-        return await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+        results = await asyncio.gather(*(search_chunk(c) for c in chunks))
+        return [hit for chunk_hits in results for hit in chunk_hits]
+
+    async def create_multiple_dashboards(
+        self,
+        dashboards: List[Dict[str, Any]],
+        max_concurrent: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Create multiple dashboards concurrently."""
+        return await self._run_bounded(dashboards, self.create_dashboard, max_concurrent)
\ No newline at end of file
@@ -4,9 +4,66 @@ Optimized data models for Prometheus and Grafana API responses.
 Simplified design with clear semantics and no redundancy.
 """
 
+import os
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Literal, Optional, Union
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+# orjson emits bytes directly and is several times faster than stdlib
+# json for summary-sized payloads; fall back transparently when it
+# isn't installed. default=str covers datetimes in either case.
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _summary_dumps(obj: Any) -> bytes:
+        return _orjson_dumps(obj, default=str)
+except ImportError:
+    import json as _json
+
+    def _summary_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj, default=str).encode()
+
+# Result payloads come from the Prometheus API itself and the fields
+# are type-cast explicitly while parsing, so the hot result path skips
+# pydantic validation by default. Set PROMTOOLS_TRUST_INPUT=0 to force
+# full validation (e.g. behind an untrusted proxy).
+_TRUST_INPUT = os.environ.get("PROMTOOLS_TRUST_INPUT", "1") != "0"
+
+# The two query kinds as shared constants: call sites compare and tag
+# results against one interned string per kind rather than spelling the
+# literal out, and the Literal-typed field below rejects typos outright.
+QUERY_TYPE_INSTANT = sys.intern("instant")
+QUERY_TYPE_RANGE = sys.intern("range")
+
+# Label values worth interning alongside the keys: these repeat across
+# nearly every series of a response, unlike free-form values.
+_INTERN_VALUE_KEYS = frozenset({"job", "instance"})
+
+
+def _display_name(name: Optional[str], query: str, limit: int = 50) -> str:
+    """Explicit name, or the query text truncated to `limit` chars."""
+    if name:
+        return name
+    if len(query) > limit:
+        return query[:limit] + "..."
+    return query
+
+
+def _intern_labels(labels: Dict[str, str]) -> Dict[str, str]:
+    """Re-key a label mapping with interned strings.
+
+    Every series of a response decodes its own copies of the same label
+    keys ("job", "instance", "pod", ...); interning collapses them to
+    one shared object each, so dict lookups and equality checks compare
+    pointers and large result sets stop duplicating the strings.
+    """
+    return {
+        sys.intern(k): sys.intern(v) if k in _INTERN_VALUE_KEYS else v
+        for k, v in labels.items()
+    }
 
 
 class Query(BaseModel):
@@ -22,30 +79,40 @@ class Query(BaseModel):
     end: Optional[datetime] = Field(None, description="结束时间")
     step: Optional[Union[str, int]] = Field(None, description="步长")
 
+    # The range/instant classification is read several times per query
+    # (dispatch, __str__, summaries) but the fields it derives from are
+    # fixed at construction, so it is computed once after validation.
+    _is_range: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def _classify(self) -> "Query":
+        self._is_range = self.start is not None and self.end is not None
+        return self
+
     def __str__(self) -> str:
         name_str = f"name='{self.name}'" if self.name else "no_name"
-        query_type = "RANGE" if self.is_range_query else "INSTANT"
+        query_type = "RANGE" if self._is_range else "INSTANT"
         return f"Query({name_str}, query='{self.query}', type={query_type})"
 
     @property
     def is_range_query(self) -> bool:
         """Check if this is a range query based on start and end presence."""
-        return self.start is not None and self.end is not None
+        return self._is_range
 
     @property
     def is_instant_query(self) -> bool:
         """Check if this is an instant query."""
-        return not self.is_range_query
+        return not self._is_range
 
     @property
     def query_type(self) -> str:
         """Get the query type as string."""
-        return "range" if self.is_range_query else "instant"
+        return QUERY_TYPE_RANGE if self._is_range else QUERY_TYPE_INSTANT
 
     @property
     def display_name(self) -> str:
         """Get display name for the query."""
-        return self.name or self.query[:50] + ("..." if len(self.query) > 50 else "")
+        return _display_name(self.name, self.query)
 
     def get_query_summary(self) -> Dict[str, Any]:
         """Get a summary of the query for logging/debugging."""
@@ -67,28 +134,91 @@ class Query(BaseModel):
         return summary
 
 
-class Metric(BaseModel):
-    """Unified metric model supporting both instant and time series data."""
-    name: str = Field(..., description="指标名称")
-    labels: Dict[str, str] = Field(default_factory=dict, description="标签")
-    value: Optional[float] = Field(None, description="即时值")
-    timestamp: Optional[datetime] = Field(None, description="时间戳")
-    values: Optional[List[Dict[str, Any]]] = Field(None, description="时间序列数据")
+@dataclass(slots=True)
+class Metric:
+    """Unified metric model supporting both instant and time series data.
+
+    A plain slots dataclass rather than a pydantic model: one Metric is
+    created per series of every response, and the dataclass drops both
+    the per-instance __dict__ and pydantic's bookkeeping while keeping
+    attribute access a C-level slot read. Time series samples are
+    stored column-wise as two float64 numpy arrays (ts/vs); the legacy
+    list-of-dicts shape remains available through the `values` property.
+    """
+    name: str
+    labels: Dict[str, str] = field(default_factory=dict)
+    value: Optional[float] = None
+    timestamp: Optional[datetime] = None
+    ts: Optional[np.ndarray] = field(default=None, repr=False)
+    vs: Optional[np.ndarray] = field(default=None, repr=False)
+    _values_view: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         if self.value is not None:
             return f"Metric(name='{self.name}', value={self.value})"
-        elif self.values:
-            return f"Metric(name='{self.name}', points={len(self.values)})"
+        elif self.vs is not None and len(self.vs):
+            return f"Metric(name='{self.name}', points={len(self.vs)})"
         else:
             return f"Metric(name='{self.name}')"
 
+    def model_dump(self) -> Dict[str, Any]:
+        """Pydantic-style dict dump kept for API compatibility."""
+        return {
+            "name": self.name,
+            "labels": self.labels,
+            "value": self.value,
+            "timestamp": self.timestamp,
+            "values": self.values,
+        }
+
+    @property
+    def values(self) -> Optional[List[Dict[str, Any]]]:
+        """Legacy row-wise view of the series (timestamp/value dicts).
+
+        Built once on first access from the columnar arrays; numeric
+        consumers should prefer timestamps_np/values_np.
+        """
+        if self.vs is None:
+            return None
+        if self._values_view is None:
+            self._values_view = [
+                {"timestamp": t, "value": v}
+                for t, v in zip(self.ts.tolist(), self.vs.tolist())
+            ]
+        return self._values_view
+
+    @property
+    def values_np(self) -> np.ndarray:
+        """Time series values as a contiguous float64 numpy array."""
+        if self.vs is None:
+            return np.empty(0, dtype=np.float64)
+        return self.vs
+
+    @property
+    def timestamps_np(self) -> np.ndarray:
+        """Time series timestamps as epoch seconds (float64 array)."""
+        if self.ts is None:
+            return np.empty(0, dtype=np.float64)
+        return self.ts
+
+    def iter_datetimes(self):
+        """Yield each sample timestamp as a datetime, on demand."""
+        if self.ts is not None:
+            for t in self.ts.tolist():
+                yield datetime.fromtimestamp(t)
+
 
 class QueryResult(BaseModel):
     """Unified query result model for both instant and range queries."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     query_name: Optional[str] = Field(None, description="查询名称")
     query: str = Field(..., description="查询语句")
-    query_type: str = Field("instant", description="查询类型: instant 或 range")
+    query_type: Literal["instant", "range"] = Field(
+        QUERY_TYPE_INSTANT, description="查询类型: instant 或 range"
+    )
     success: bool = Field(..., description="是否成功")
     status: str = Field(..., description="查询状态")
     metrics: List[Metric] = Field(default_factory=list, description="指标数据")
@@ -104,17 +234,17 @@ class QueryResult(BaseModel):
     @property
     def display_name(self) -> str:
         """Get display name for the query result."""
-        return self.query_name or self.query[:50] + ("..." if len(self.query) > 50 else "")
+        return _display_name(self.query_name, self.query)
 
     @property
     def is_range_query(self) -> bool:
         """Check if this is a range query result."""
-        return self.query_type == "range"
+        return self.query_type == QUERY_TYPE_RANGE
 
     @property
     def is_instant_query(self) -> bool:
         """Check if this is an instant query result."""
-        return self.query_type == "instant"
+        return self.query_type == QUERY_TYPE_INSTANT
 
     def get_result_summary(self) -> Dict[str, Any]:
         """Get a summary of the result for logging/debugging."""
@@ -144,14 +274,34 @@ class QueryResult(BaseModel):
                 "value": metric.value,
                 "labels": labels_str,
                 "timestamp": metric.timestamp,
-                "data_points": len(metric.values) if metric.values else 0
+                "data_points": len(metric.vs) if metric.vs is not None else 0
             })
         return summary
 
+    def to_json_bytes(self, limit: int = 3) -> bytes:
+        """Serialize the result and metrics summaries to JSON bytes.
+
+        Encodes straight to bytes for logging or transport, skipping
+        the intermediate str that a json.dumps() round trip would
+        allocate. `limit` bounds the metrics included, mirroring
+        get_metrics_summary.
+        """
+        payload = self.get_result_summary()
+        payload["metrics"] = self.get_metrics_summary(limit=limit)
+        return _summary_dumps(payload)
+
     @classmethod
     def from_response(cls, query_name: Optional[str], query: str, response: Dict[str, Any],
-                     execution_time: Optional[float] = None, query_type: str = "instant") -> "QueryResult":
-        """Create result from Prometheus API response."""
+                     execution_time: Optional[float] = None, query_type: str = QUERY_TYPE_INSTANT,
+                     keep_raw: bool = False) -> "QueryResult":
+        """Create result from Prometheus API response.
+
+        Once the metrics are extracted the decoded response tree only
+        duplicates them, so successful results drop it by default and
+        let it be garbage-collected; pass keep_raw=True to retain the
+        raw payload on `data`. Failed responses always keep it for
+        diagnosis.
+        """
         status = response.get("status", "unknown")
 
         if status != "success":
@@ -166,6 +316,12 @@ class QueryResult(BaseModel):
                 data=response
             )
 
+        # In trusted mode the casts below (float, fromtimestamp) are the
+        # only checks the data needs, so validation is bypassed. Metric
+        # itself is a plain dataclass whose __init__ is already
+        # validation-free, so only the result object depends on the flag.
+        make_result = cls.model_construct if _TRUST_INPUT else cls
+
         metrics = []
         if "data" in response:
             data = response["data"]
@@ -173,8 +329,13 @@ class QueryResult(BaseModel):
             results = data.get("result", [])
 
             for item in results:
-                metric_name = item.get("metric", {}).get("__name__", "unknown")
-                labels = {k: v for k, v in item.get("metric", {}).items() if k != "__name__"}
+                # The just-parsed response is ours to mutate: popping
+                # __name__ turns the decoded dict into the labels
+                # mapping. Interning re-keys it — a small rebuild — but
+                # deduplicates the label strings across all series.
+                labels = item.get("metric") or {}
+                metric_name = sys.intern(labels.pop("__name__", "unknown"))
+                labels = _intern_labels(labels)
 
                 if result_type == "vector":
                     value_data = item.get("value")
@@ -187,33 +348,36 @@ class QueryResult(BaseModel):
                         ))
 
                 elif result_type == "matrix":
-                    values = []
-                    for value_pair in item.get("values", []):
-                        if len(value_pair) >= 2:
-                            values.append({
-                                "timestamp": datetime.fromtimestamp(value_pair[0]),
-                                "value": float(value_pair[1])
-                            })
+                    # One trip into C per series: numpy coerces the
+                    # [epoch, "value"] pairs (including "NaN"/"+Inf")
+                    # to float64 in bulk, replacing 2*P interpreted
+                    # float()/append calls. Timestamps stay epoch
+                    # floats; Metric.iter_datetimes() materializes
+                    # datetimes on demand.
+                    raw = item.get("values") or []
+                    arr = np.asarray(raw, dtype=np.float64).reshape(-1, 2)
                     metrics.append(Metric(
                         name=metric_name,
                         labels=labels,
-                        values=values
+                        ts=np.ascontiguousarray(arr[:, 0]),
+                        vs=np.ascontiguousarray(arr[:, 1]),
                     ))
 
-        return cls(
+        return make_result(
             query_name=query_name,
             query=query,
             query_type=query_type,
             success=True,
             status=status,
             metrics=metrics,
+            error=None,
             execution_time=execution_time,
-            data=response
+            data=response if keep_raw else None
         )
 
     @classmethod
     def from_error(cls, query_name: Optional[str], query: str, error: Exception,
-                   execution_time: Optional[float] = None, query_type: str = "instant") -> "QueryResult":
+                   execution_time: Optional[float] = None, query_type: str = QUERY_TYPE_INSTANT) -> "QueryResult":
         """Create result from exception."""
         return cls(
             query_name=query_name,
@@ -261,18 +425,37 @@ class GrafanaFolder(BaseModel):
 
 # Simplified Prometheus management models
 class PrometheusTarget(BaseModel):
-    """Prometheus target model."""
-    instance: str = Field(..., description="目标实例")
-    job: str = Field(..., description="作业名称")
-    health: str = Field(..., description="健康状态")
-    last_error: Optional[str] = None
-    scrape_interval: Optional[str] = None
-    scrape_timeout: Optional[str] = None
+    """Prometheus target model.
+
+    Field aliases match the camelCase keys of the /api/v1/targets
+    payload, so a raw activeTargets entry validates directly without a
+    hand-written key-by-key translation in the client.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    instance: str = Field("unknown", description="目标实例")
+    job: str = Field("unknown", description="作业名称")
+    health: str = Field("", description="健康状态")
+    last_error: Optional[str] = Field(None, alias="lastError")
+    scrape_interval: Optional[str] = Field("", alias="scrapeInterval")
+    scrape_timeout: Optional[str] = Field("", alias="scrapeTimeout")
     labels: Dict[str, str] = Field(default_factory=dict)
-    discovered_labels: Dict[str, str] = Field(default_factory=dict)
-    scrape_pool: Optional[str] = None
-    scrape_url: Optional[str] = None
-    global_url: Optional[str] = None
+    discovered_labels: Dict[str, str] = Field(
+        default_factory=dict, alias="discoveredLabels"
+    )
+    scrape_pool: Optional[str] = Field("", alias="scrapePool")
+    scrape_url: Optional[str] = Field("", alias="scrapeUrl")
+    global_url: Optional[str] = Field("", alias="globalUrl")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _derive_identity(cls, data: Any) -> Any:
+        """Pull instance/job out of the target's label set."""
+        if isinstance(data, dict) and "instance" not in data:
+            labels = data.get("labels") or {}
+            data["instance"] = labels.get("__address__", "unknown")
+            data["job"] = labels.get("job", "unknown")
+        return data
 
 
 class PrometheusRule(BaseModel):
@@ -3,13 +3,19 @@ Prometheus API client with async support.
 """
 
 import asyncio
+import base64
+import re
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Union
 from urllib.parse import urlencode
 
+from pydantic import TypeAdapter
+
 from .base import BaseAsyncClient
 from .models import (
+    QUERY_TYPE_INSTANT,
+    QUERY_TYPE_RANGE,
     Query,
     QueryResult,
     Metric,
@@ -19,6 +25,37 @@ from .models import (
 from .exceptions import PrometheusError
 
 
+# A query that is just a bare metric name and can therefore be fused
+# into a single {__name__=~"..."} selector with other such queries
+_METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+# Validates a whole activeTargets list in one core-level pass instead
+# of constructing models one by one in a Python loop
+_TARGETS_ADAPTER = TypeAdapter(List[PrometheusTarget])
+
+# Same bulk-validation trick for query definition dicts
+_QUERY_LIST_ADAPTER = TypeAdapter(List[Query])
+
+
+class PreparedQuery:
+    """Pre-encoded instant query for repeated execution.
+
+    Caches the URL-encoded parameter string so re-running the same
+    PromQL text skips per-call param-dict construction and encoding.
+    Create instances via PrometheusClient.prepare().
+    """
+
+    __slots__ = ("query", "endpoint", "encoded_params")
+
+    def __init__(self, query: str, endpoint: str, encoded_params: str) -> None:
+        self.query = query
+        self.endpoint = endpoint
+        self.encoded_params = encoded_params
+
+    def __str__(self) -> str:
+        return f"PreparedQuery(query='{self.query}')"
+
+
 class PrometheusClient(BaseAsyncClient):
     """Async Prometheus API client."""
 
@@ -28,6 +65,7 @@ class PrometheusClient(BaseAsyncClient):
         username: Optional[str] = None,
         password: Optional[str] = None,
         token: Optional[str] = None,
+        cache_ttl: float = 0,
         **kwargs
     ) -> None:
         super().__init__(base_url=url, **kwargs)
@@ -35,19 +73,106 @@ class PrometheusClient(BaseAsyncClient):
         self.password = password
         self.token = token
 
-    def _prepare_auth_headers(self) -> Dict[str, str]:
-        """Prepare authentication headers."""
-        headers = {}
+        # Optional read-aside cache keyed on the fully-bound query text.
+        # Disabled by default (cache_ttl=0); repeated identical queries
+        # within the TTL window are served from memory.
+        self.cache_ttl = cache_ttl
+        self._query_cache: Dict[str, tuple] = {}
+
+        # Credentials never change after construction, so the base64
+        # encode and header dict are built once instead of per request
+        self._auth_headers = self._build_auth_headers()
+
+    def _cache_get(self, key: str) -> Optional[QueryResult]:
+        """Return a cached result if present and not expired."""
+        if not self.cache_ttl:
+            return None
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if time.time() - cached_at > self.cache_ttl:
+            del self._query_cache[key]
+            return None
+        # Shallow copy so callers that set query_name/execution_time on
+        # a hit (query_multiple does) never mutate the cached entry;
+        # the metrics list itself is shared, which callers treat as
+        # read-only
+        return result.model_copy()
+
+    def _cache_put(self, key: str, result: QueryResult) -> None:
+        """Store a successful result in the cache."""
+        if self.cache_ttl and result.success:
+            self._query_cache[key] = (time.time(), result)
+
+    def cache_clear(self) -> None:
+        """Drop all cached query results."""
+        self._query_cache.clear()
+
+    async def warmup(self, n: int = 4) -> None:
+        """Pre-open keep-alive connections to the server.
+
+        Issues n concurrent requests against the readiness endpoint so
+        the first wave of concurrent queries does not pay TCP/TLS
+        handshakes inline. Warmup is best-effort; failures are ignored.
+        """
+        await self._ensure_session()
+
+        async def ping() -> None:
+            try:
+                async with self._session.head(f"{self.base_url}/-/ready") as response:
+                    await response.read()
+            except Exception:
+                pass
+
+        await asyncio.gather(*(ping() for _ in range(n)))
+
+    def prepare(self, query: Union[str, Query]) -> PreparedQuery:
+        """Prepare an instant query for repeated execution.
+
+        The returned PreparedQuery carries the endpoint and the
+        URL-encoded parameters, so executing it many times only pays
+        the network round trip.
+        """
+        query_text = query.query if isinstance(query, Query) else query
+        return PreparedQuery(
+            query=query_text,
+            endpoint="api/v1/query",
+            encoded_params=urlencode({"query": query_text}),
+        )
+
+    async def query_prepared(self, prepared: PreparedQuery) -> QueryResult:
+        """Execute a prepared instant query."""
+        try:
+            response = await self._request(
+                "GET",
+                f"{prepared.endpoint}?{prepared.encoded_params}",
+                headers=self._auth_headers,
+            )
+            return QueryResult.from_response(None, prepared.query, response, query_type=QUERY_TYPE_INSTANT)
+        except Exception as e:
+            return QueryResult.from_error(None, prepared.query, e, query_type=QUERY_TYPE_INSTANT)
+
+    def _build_auth_headers(self) -> Dict[str, str]:
+        """Build the cached request header dict (defaults + auth).
+
+        Folding the client default headers in here lets the base
+        client send the mapping as-is instead of merging per request.
+        """
+        headers = dict(self._default_headers)
 
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         elif self.username and self.password:
-            import base64
             credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
             headers["Authorization"] = f"Basic {credentials}"
 
         return headers
 
+    def _prepare_auth_headers(self) -> Dict[str, str]:
+        """Prepare authentication headers."""
+        return self._auth_headers
+
     async def query(
         self,
         query: str,
@@ -55,25 +180,34 @@ class PrometheusClient(BaseAsyncClient):
         timeout: Optional[str] = None,
     ) -> QueryResult:
         """Execute an instant query."""
-        params = {"query": query}
+        cache_key = f"{query}|{query_time}|||"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # aiohttp expands params pairwise anyway, so a pair list skips
+        # building (and hashing into) an intermediate dict per call
+        params = [("query", query)]
 
         if query_time:
-            params["time"] = query_time.timestamp()
+            params.append(("time", query_time.timestamp()))
         if timeout:
-            params["timeout"] = timeout
+            params.append(("timeout", timeout))
 
         try:
             response = await self._request(
                 "GET",
                 "api/v1/query",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
-            return QueryResult.from_response(None, query, response, query_type="instant")
+            result = QueryResult.from_response(None, query, response, query_type=QUERY_TYPE_INSTANT)
+            self._cache_put(cache_key, result)
+            return result
         except asyncio.CancelledError as e:
-            return QueryResult.from_error(None, query, e, query_type="instant")
+            return QueryResult.from_error(None, query, e, query_type=QUERY_TYPE_INSTANT)
         except Exception as e:
-            return QueryResult.from_error(None, query, e, query_type="instant")
+            return QueryResult.from_error(None, query, e, query_type=QUERY_TYPE_INSTANT)
 
     async def query_range(
         self,
@@ -87,26 +221,33 @@ class PrometheusClient(BaseAsyncClient):
         if isinstance(step, timedelta):
             step = f"{step.total_seconds()}s"
 
-        params = {
-            "query": query,
-            "start": start.timestamp(),
-            "end": end.timestamp(),
-            "step": step,
-        }
+        cache_key = f"{query}|{start}|{end}|{step}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = [
+            ("query", query),
+            ("start", start.timestamp()),
+            ("end", end.timestamp()),
+            ("step", step),
+        ]
 
         if timeout:
-            params["timeout"] = timeout
+            params.append(("timeout", timeout))
 
         try:
             response = await self._request(
                 "GET",
                 "api/v1/query_range",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
-            return QueryResult.from_response(None, query, response, query_type="range")
+            result = QueryResult.from_response(None, query, response, query_type=QUERY_TYPE_RANGE)
+            self._cache_put(cache_key, result)
+            return result
         except Exception as e:
-            return QueryResult.from_error(None, query, e, query_type="range")
+            return QueryResult.from_error(None, query, e, query_type=QUERY_TYPE_RANGE)
 
     async def query_series(
         self,
@@ -127,7 +268,7 @@ class PrometheusClient(BaseAsyncClient):
                 "GET",
                 "api/v1/series",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
             return response.get("data", [])
         except Exception as e:
@@ -154,7 +295,7 @@ class PrometheusClient(BaseAsyncClient):
                 "GET",
                 "api/v1/labels",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
             return response.get("data", [])
         except Exception as e:
@@ -182,7 +323,7 @@ class PrometheusClient(BaseAsyncClient):
                 "GET",
                 f"api/v1/label/{label}/values",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
             return response.get("data", [])
         except Exception as e:
@@ -195,7 +336,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/targets",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get targets: {str(e)}")
@@ -206,23 +347,10 @@ class PrometheusClient(BaseAsyncClient):
             response = await self.get_targets()
             targets_data = response.get("data", {}).get("activeTargets", [])
 
-            targets = []
-            for target in targets_data:
-                labels = target.get("labels", {})
-                targets.append(PrometheusTarget(
-                    instance=labels.get("__address__", "unknown"),
-                    job=labels.get("job", "unknown"),
-                    health=target.get("health", ""),
-                    last_error=target.get("lastError"),
-                    scrape_interval=target.get("scrapeInterval", ""),
-                    scrape_timeout=target.get("scrapeTimeout", ""),
-                    labels=labels,
-                    discovered_labels=target.get("discoveredLabels", {}),
-                    scrape_pool=target.get("scrapePool", ""),
-                    scrape_url=target.get("scrapeUrl", ""),
-                    global_url=target.get("globalUrl", ""),
-                ))
-            return targets
+            # PrometheusTarget aliases mirror the payload's camelCase
+            # keys and its validator derives instance/job from labels,
+            # so the whole list validates in one adapter call
+            return _TARGETS_ADAPTER.validate_python(targets_data)
         except Exception as e:
             raise PrometheusError(f"Failed to get detailed targets: {str(e)}")
 
@@ -232,7 +360,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/rules",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get rules: {str(e)}")
@@ -243,7 +371,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/alerts",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get alerts: {str(e)}")
@@ -254,7 +382,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/alertmanagers",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get alert managers: {str(e)}")
@@ -279,7 +407,7 @@ class PrometheusClient(BaseAsyncClient):
                 "POST",
                 "api/v1/admin/tsdb/delete_series",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to delete series: {str(e)}")
@@ -290,7 +418,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "POST",
                 "api/v1/admin/tsdb/clean_tombstones",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to clean tombstones: {str(e)}")
@@ -308,7 +436,7 @@ class PrometheusClient(BaseAsyncClient):
                 "POST",
                 "api/v1/admin/tsdb/snapshot",
                 params=params,
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to create snapshot: {str(e)}")
@@ -320,8 +448,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "-/healthy",
-                headers=self._prepare_auth_headers(),
-                use_httpx=True,
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get health status: {str(e)}")
@@ -332,8 +459,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "-/ready",
-                headers=self._prepare_auth_headers(),
-                use_httpx=True,
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get readiness status: {str(e)}")
@@ -344,7 +470,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/status/config",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get configuration: {str(e)}")
@@ -355,7 +481,7 @@ class PrometheusClient(BaseAsyncClient):
             return await self._request(
                 "GET",
                 "api/v1/status/flags",
-                headers=self._prepare_auth_headers(),
+                headers=self._auth_headers,
             )
         except Exception as e:
             raise PrometheusError(f"Failed to get flags: {str(e)}")
@@ -397,7 +523,194 @@ class PrometheusClient(BaseAsyncClient):
             ]
             results = await client.query_multiple(queries)
         """
+        # All-string batches — the common "list of PromQL" call — skip
+        # Query construction entirely: no names, types or ranges to
+        # resolve, so each string dispatches straight to query()
+        if all(type(q) is str for q in queries):
+            async def execute_plain(query_text: str) -> QueryResult:
+                start_time = time.time()
+                result = await self.query(query_text, query_time)
+                result.execution_time = time.time() - start_time
+                return result
+
+            return await self._run_indexed(queries, execute_plain, max_concurrent)
+
         # Convert all inputs to Query objects and validate
+        query_objects = self._coerce_queries(queries)
+
+        async def execute_single_query(query_obj: Query) -> QueryResult:
+            """Execute a single Query object - simplified to only handle Query models."""
+            start_time = time.time()
+
+            try:
+                # Execute the query based on its type
+                if query_obj.is_range_query:
+                    result = await self.query_range(
+                        query=query_obj.query,
+                        start=query_obj.start,
+                        end=query_obj.end,
+                        step=query_obj.step,
+                        timeout=query_obj.timeout
+                    )
+                else:
+                    result = await self.query(query_obj.query, query_time, query_obj.timeout)
+
+                # Update execution time and query name
+                execution_time = time.time() - start_time
+                result.execution_time = execution_time
+                if query_obj.name:
+                    result.query_name = query_obj.name
+                return result
+            except Exception as e:
+                execution_time = time.time() - start_time
+                return QueryResult.from_error(
+                    query_obj.name,
+                    query_obj.query,
+                    e,
+                    execution_time,
+                    query_obj.query_type
+                )
+
+        return await self._run_indexed(query_objects, execute_single_query, max_concurrent)
+
+    async def _run_indexed(
+        self,
+        items: List[Any],
+        worker,
+        max_concurrent: int,
+    ) -> List[Any]:
+        """Fill a preallocated result list with `await worker(item)`.
+
+        A fixed set of worker coroutines drains one shared iterator:
+        no semaphore waiter queue, no per-item closure or task object.
+        Pulling from the iterator is safe because no await happens
+        between fetching a pair and starting its work. `worker` is
+        expected to capture its own failures (as execute_single_query
+        does via QueryResult.from_error).
+        """
+        results: List[Any] = [None] * len(items)
+        pairs = iter(enumerate(items))
+
+        async def run() -> None:
+            for index, item in pairs:
+                results[index] = await worker(item)
+
+        worker_count = min(max_concurrent, len(items)) or 1
+        await asyncio.gather(*(run() for _ in range(worker_count)))
+        return results
+
+    async def query_batch(
+        self,
+        queries: List[Union[str, Query, Dict[str, Any]]],
+        query_time: Optional[datetime] = None,
+        max_concurrent: int = 10,
+    ) -> List[QueryResult]:
+        """Execute multiple queries with de-duplication of identical queries.
+
+        Queries with the same PromQL text and time range are sent to the
+        server only once; the result list is then expanded back to match
+        the original input order. Useful when the same query is repeated
+        many times in one batch.
+
+        Args:
+            queries: List of queries (strings, Query objects, or range query dicts)
+            query_time: Optional time parameter for instant queries
+            max_concurrent: Maximum number of concurrent queries
+
+        Returns:
+            List of QueryResult objects, one per input query
+        """
+        query_objects = self._coerce_queries(queries)
+
+        def dedup_key(query_obj: Query):
+            return (query_obj.query, query_obj.start, query_obj.end, str(query_obj.step))
+
+        unique_index: Dict[Any, int] = {}
+        unique_queries: List[Query] = []
+        for query_obj in query_objects:
+            key = dedup_key(query_obj)
+            if key not in unique_index:
+                unique_index[key] = len(unique_queries)
+                unique_queries.append(query_obj)
+
+        unique_results = await self.query_multiple(unique_queries, query_time, max_concurrent)
+
+        results = []
+        for query_obj in query_objects:
+            result = unique_results[unique_index[dedup_key(query_obj)]]
+            if query_obj.name and query_obj.name != result.query_name:
+                result = result.model_copy(update={"query_name": query_obj.name})
+            results.append(result)
+        return results
+
+    async def query_batch_server(
+        self,
+        queries: List[Union[str, Query, Dict[str, Any]]],
+        query_time: Optional[datetime] = None,
+        max_concurrent: int = 10,
+    ) -> List[QueryResult]:
+        """Execute instant queries in as few server round trips as possible.
+
+        Queries that are plain metric names are fused into a single
+        {__name__=~"a|b|..."} selector query and split back per metric
+        name on the client. Anything more complex (functions, labels,
+        range queries) falls back to the de-duplicated concurrent path.
+
+        Args:
+            queries: List of queries (strings, Query objects, or range query dicts)
+            query_time: Optional time parameter for instant queries
+            max_concurrent: Maximum number of concurrent fallback queries
+
+        Returns:
+            List of QueryResult objects, one per input query
+        """
+        query_objects = self._coerce_queries(queries)
+
+        fusable = [
+            q for q in query_objects
+            if q.is_instant_query and _METRIC_NAME_RE.match(q.query)
+        ]
+        if len(fusable) < 2:
+            return await self.query_batch(query_objects, query_time, max_concurrent)
+
+        names = sorted({q.query for q in fusable})
+        fused = await self.query('{__name__=~"%s"}' % "|".join(names), query_time)
+
+        by_name: Dict[str, List[Metric]] = {}
+        for metric in fused.metrics:
+            by_name.setdefault(metric.name, []).append(metric)
+
+        results: List[Optional[QueryResult]] = [None] * len(query_objects)
+        fallback_indices = []
+        for i, query_obj in enumerate(query_objects):
+            if query_obj.is_instant_query and _METRIC_NAME_RE.match(query_obj.query):
+                results[i] = QueryResult(
+                    query_name=query_obj.name,
+                    query=query_obj.query,
+                    query_type=QUERY_TYPE_INSTANT,
+                    success=fused.success,
+                    status=fused.status,
+                    metrics=by_name.get(query_obj.query, []),
+                    error=fused.error,
+                    execution_time=fused.execution_time,
+                )
+            else:
+                fallback_indices.append(i)
+
+        if fallback_indices:
+            fallback_results = await self.query_batch(
+                [query_objects[i] for i in fallback_indices],
+                query_time,
+                max_concurrent,
+            )
+            for i, result in zip(fallback_indices, fallback_results):
+                results[i] = result
+
+        return results
+
+    @staticmethod
+    def _coerce_queries(queries: List[Union[str, Query, Dict[str, Any]]]) -> List[Query]:
+        """Convert mixed query inputs to validated Query objects."""
         query_objects = []
         for query_input in queries:
             if isinstance(query_input, str):
@@ -423,45 +736,7 @@ class PrometheusClient(BaseAsyncClient):
                 raise ValueError(f"Unsupported query type: {type(query_input)}")
 
             query_objects.append(query_obj)
-
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def execute_single_query(query_obj: Query) -> QueryResult:
-            """Execute a single Query object - simplified to only handle Query models."""
-            async with semaphore:
-                start_time = time.time()
-
-                try:
-                    # Execute the query based on its type
-                    if query_obj.is_range_query:
-                        result = await self.query_range(
-                            query=query_obj.query,
-                            start=query_obj.start,
-                            end=query_obj.end,
-                            step=query_obj.step,
-                            timeout=query_obj.timeout
-                        )
-                    else:
-                        result = await self.query(query_obj.query, query_time, query_obj.timeout)
-
-                    # Update execution time and query name
-                    execution_time = time.time() - start_time
-                    result.execution_time = execution_time
-                    if query_obj.name:
-                        result.query_name = query_obj.name
-                    return result
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    return QueryResult.from_error(
-                        query_obj.name,
-                        query_obj.query,
-                        e,
-                        execution_time,
-                        query_obj.query_type
-                    )
-
-        tasks = [execute_single_query(query_obj) for query_obj in query_objects]
-        return await asyncio.gather(*tasks)
+        return query_objects
 
     @staticmethod
     def create_queries(queries: List[Dict[str, Any]]) -> List[Query]:
@@ -473,18 +748,8 @@ class PrometheusClient(BaseAsyncClient):
         Returns:
             List of Query objects
         """
-        query_objects = []
-        for query_dict in queries:
-            query_objects.append(Query(
-                name=query_dict["name"],
-                query=query_dict["query"],
-                description=query_dict.get("description"),
-                category=query_dict.get("category"),
-                timeout=query_dict.get("timeout"),
-                start=query_dict.get("start"),
-                end=query_dict.get("end"),
-                step=query_dict.get("step")
-            ))
-        return query_objects
+        # Query's optional fields already default to None, so the dicts
+        # validate as-is in one adapter pass — no per-key .get() loop
+        return _QUERY_LIST_ADAPTER.validate_python(queries)
 
     
\ No newline at end of file
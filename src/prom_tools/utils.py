@@ -3,14 +3,50 @@ Utility functions for prom-tools.
 """
 
 import asyncio
+import functools
 import json
-from datetime import datetime, timedelta
+import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The overwhelmingly common Prometheus timestamp shape. Building the
+# datetime straight from the captured digits skips both the full ISO
+# state machine and the Z-rewriting .replace() allocation.
+_FAST_ISO = re.compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(Z?)$")
+
+# ciso8601 parses ISO-8601 strings in C roughly an order of magnitude
+# faster than datetime.fromisoformat and understands the trailing "Z"
+# natively, skipping the throwaway .replace() string; fall back to the
+# stdlib parser when it isn't installed.
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    def _parse_datetime(value: str) -> datetime:
+        match = _FAST_ISO.match(value)
+        if match:
+            y, mo, d, h, mi, s, z = match.groups()
+            return datetime(
+                int(y), int(mo), int(d), int(h), int(mi), int(s),
+                tzinfo=timezone.utc if z else None,
+            )
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# orjson encodes dashboard-sized payloads 5-10x faster than stdlib
+# json (whose pretty printer in particular is pure Python) and emits
+# bytes that can be written in one call; optional like ciso8601 above.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 def parse_time_range(
     start: Union[str, datetime, timedelta],
@@ -26,48 +62,79 @@ def parse_time_range(
     Returns:
         Tuple of (start_datetime, end_datetime)
     """
-    now = datetime.now()
+    # The wall clock is read only when an argument actually needs it
+    # (and at most once); the pure (datetime, datetime) and string
+    # paths make no clock call at all
+    now = None
 
     if isinstance(start, timedelta):
+        now = datetime.now()
         start = now - start
     elif isinstance(start, str):
-        start = datetime.fromisoformat(start.replace('Z', '+00:00'))
+        start = _parse_datetime(start)
 
     if end is None:
-        end = now
+        end = now if now is not None else datetime.now()
     elif isinstance(end, timedelta):
+        if now is None:
+            now = datetime.now()
         end = now - end
     elif isinstance(end, str):
-        end = datetime.fromisoformat(end.replace('Z', '+00:00'))
+        end = _parse_datetime(end)
 
     return start, end
 
 
+# Unit scales for format_duration, largest first; the 1.0 entry is the
+# unconditional fallback so the loop always returns
+_DURATION_UNITS = ((3600.0, "h"), (60.0, "m"), (1.0, "s"))
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human readable string."""
-    if seconds < 60:
-        return f"{seconds:.2f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.2f}m"
-    else:
-        hours = seconds / 3600
-        return f"{hours:.2f}h"
+    for scale, suffix in _DURATION_UNITS:
+        if seconds >= scale or scale == 1.0:
+            return f"{seconds / scale:.2f}{suffix}"
+
 
+# Compiled once: sanitize_metric_name runs per ingested metric, and
+# re.sub with a string pattern re-consults the compile cache each call.
+# The bound .sub also skips the method lookup on the hot path.
+_METRIC_SANITIZE_SUB = re.compile(r'[^a-zA-Z0-9_]').sub
 
+# First characters that force the metric_ prefix; sanitized[:1] is in
+# this set iff the name is empty-safe-sliced to a digit or underscore
+_BAD_PREFIX = frozenset('_0123456789')
+
+
+# Memoized: callers sanitize per-sample but draw from the bounded set
+# of distinct metric names, so repeats collapse to one dict lookup and
+# hits return the already-built string instead of allocating a new one.
+# sanitize_metric_name.cache_clear() resets the cache if needed.
+@functools.lru_cache(maxsize=4096)
 def sanitize_metric_name(name: str) -> str:
     """Sanitize metric name for safe usage."""
-    import re
     # Replace invalid characters with underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+    sanitized = _METRIC_SANITIZE_SUB('_', name)
     # Ensure it doesn't start with underscore or digit
-    if sanitized and (sanitized[0].isdigit() or sanitized[0] == '_'):
+    if sanitized[:1] in _BAD_PREFIX:
         sanitized = f"metric_{sanitized}"
     return sanitized
 
 
 def merge_labels(*label_dicts: Dict[str, str]) -> Dict[str, str]:
     """Merge multiple label dictionaries, with later ones taking precedence."""
+    # The 1- and 2-dict calls dominate; unpacking merges them in a
+    # single C-level bytecode with one resize instead of a Python loop
+    # of .update() calls. None entries count as empty, as before.
+    n = len(label_dicts)
+    if n == 0:
+        return {}
+    if n == 1:
+        return dict(label_dicts[0] or ())
+    if n == 2:
+        return {**(label_dicts[0] or {}), **(label_dicts[1] or {})}
+
     result = {}
     for labels in label_dicts:
         if labels:
@@ -101,22 +168,56 @@ def create_alert_rule(
     Returns:
         Alert rule dictionary
     """
-    rule = {
+    # Most rules are generated without extra labels/annotations; that
+    # path builds the nested dicts directly instead of spreading a
+    # throwaway empty dict into each of them per call.
+    if labels is None and annotations is None:
+        return {
+            "alert": name,
+            "expr": expr,
+            "for": for_duration,
+            "labels": {"severity": severity},
+            "annotations": {
+                "summary": summary or f"Alert: {name}",
+                "description": description or f"Alert triggered for {name}",
+            },
+        }
+
+    # Conditional .update() instead of **(x or {}): no empty-dict
+    # stand-in is allocated when only one of the two is supplied
+    lbl = {"severity": severity}
+    if labels:
+        lbl.update(labels)
+
+    ann = {
+        "summary": summary or f"Alert: {name}",
+        "description": description or f"Alert triggered for {name}",
+    }
+    if annotations:
+        ann.update(annotations)
+
+    return {
         "alert": name,
         "expr": expr,
         "for": for_duration,
-        "labels": {
-            "severity": severity,
-            **(labels or {}),
-        },
-        "annotations": {
-            "summary": summary or f"Alert: {name}",
-            "description": description or f"Alert triggered for {name}",
-            **(annotations or {}),
-        },
+        "labels": lbl,
+        "annotations": ann,
     }
 
-    return rule
+
+def create_alert_rules_batch(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create many alert rule definitions in one pass.
+
+    Args:
+        specs: List of dicts of create_alert_rule keyword arguments
+            (at least 'name' and 'expr')
+
+    Returns:
+        List of alert rule dictionaries
+    """
+    build = create_alert_rule
+    return [build(**spec) for spec in specs]
 
 
 def create_recording_rule(
@@ -167,6 +268,25 @@ def create_prometheus_rule_group(
     }
 
 
+# Static dashboard fields, laid out once; dynamic keys are present as
+# None placeholders so per-call assignment hits existing slots
+_DASH_SKELETON = {
+    "id": None,
+    "title": None,
+    "tags": None,
+    "timezone": "browser",
+    "panels": None,
+    "time": None,
+    "refresh": None,
+    "schemaVersion": 38,
+    "version": 1,
+    "templating": None,
+}
+
+_DEFAULT_TIME = {"from": "now-1h", "to": "now"}
+_DEFAULT_GRID_POS = {"x": 0, "y": 0, "w": 12, "h": 8}
+
+
 def create_grafana_dashboard(
     title: str,
     panels: List[Dict[str, Any]],
@@ -191,21 +311,18 @@ def create_grafana_dashboard(
     Returns:
         Dashboard dictionary
     """
-    dashboard = {
-        "id": None,
-        "title": title,
-        "tags": tags or [],
-        "timezone": "browser",
-        "panels": panels,
-        "time": time or {
-            "from": "now-1h",
-            "to": "now"
-        },
-        "refresh": refresh,
-        "schemaVersion": 38,
-        "version": 1,
-        "templating": templating or {"list": []},
-    }
+    # Copy the frozen skeleton and fill in the dynamic slots: the
+    # static fields are hashed and laid out once at import instead of
+    # being rebuilt per call, and assigning into pre-existing keys
+    # never resizes the dict. Mutable defaults are still copied per
+    # dashboard so callers can edit them safely.
+    dashboard = _DASH_SKELETON.copy()
+    dashboard["title"] = title
+    dashboard["tags"] = tags or []
+    dashboard["panels"] = panels
+    dashboard["time"] = time or dict(_DEFAULT_TIME)
+    dashboard["refresh"] = refresh
+    dashboard["templating"] = templating or {"list": []}
 
     if uid:
         dashboard["uid"] = uid
@@ -249,7 +366,7 @@ def create_grafana_panel(
                 "refId": "A",
             }
         ],
-        "gridPos": position or {"x": 0, "y": 0, "w": 12, "h": 8},
+        "gridPos": position or dict(_DEFAULT_GRID_POS),
     }
 
     if description:
@@ -258,32 +375,164 @@ def create_grafana_panel(
     return panel
 
 
+def create_grafana_panels_batch(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create many Grafana panel definitions in one pass.
+
+    Args:
+        specs: List of dicts of create_grafana_panel keyword arguments
+            (at least 'title', 'expr' and 'datasource')
+
+    Returns:
+        List of panel dictionaries
+    """
+    build = create_grafana_panel
+    return [build(**spec) for spec in specs]
+
+
 async def batch_execute(
     tasks: List[Awaitable],
     batch_size: int = 10,
     delay_between_batches: float = 0.1,
+    mode: str = "streaming",
 ) -> List[Any]:
     """
-    Execute tasks in batches to avoid overwhelming the system.
+    Execute tasks with bounded concurrency to avoid overwhelming the system.
+
+    In the default "streaming" mode up to batch_size tasks are kept in
+    flight at all times: a new task starts as soon as any slot frees,
+    instead of the whole batch waiting on its slowest member. Task
+    starts are paced delay_between_batches/batch_size apart, preserving
+    the original average launch rate. mode="batched" restores the
+    strict lockstep batches with a sleep between them.
 
     Args:
         tasks: List of awaitable tasks
         batch_size: Number of tasks to execute concurrently
-        delay_between_batches: Delay between batches in seconds
+        delay_between_batches: Delay budget per batch_size task starts
+        mode: "streaming" (keep the pipe full) or "batched" (lockstep)
 
     Returns:
-        List of results
+        List of results (exceptions are returned in place)
+    """
+    # Locals skip the asyncio attribute lookups in the loops below
+    _sleep = asyncio.sleep
+
+    if batch_size == 1:
+        # Fully serial either way: await each task directly and skip
+        # the gather/TaskGroup machinery entirely
+        results = []
+        last = len(tasks) - 1
+        for i, task in enumerate(tasks):
+            try:
+                results.append(await task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                results.append(e)
+            if delay_between_batches > 0 and i < last:
+                await _sleep(delay_between_batches)
+        return results
+
+    if mode == "batched":
+        _gather = asyncio.gather
+        results = []
+
+        for i in range(0, len(tasks), batch_size):
+            batch = tasks[i:i + batch_size]
+            batch_results = await _gather(*batch, return_exceptions=True)
+            results.extend(batch_results)
+
+            # Add delay between batches (except for the last batch)
+            if i + batch_size < len(tasks):
+                await _sleep(delay_between_batches)
+
+        return results
+
+    if mode != "streaming":
+        raise ValueError(f"Unknown batch_execute mode: {mode}")
+
+    sem = asyncio.Semaphore(batch_size)
+    spacing = delay_between_batches / batch_size if delay_between_batches > 0 else 0
+    pacer = asyncio.Lock()
+    results = [None] * len(tasks)
+
+    async def run(index: int, task: Awaitable) -> None:
+        async with sem:
+            if spacing:
+                # Serialize a short sleep per start so launches stay
+                # spaced without ever idling the whole group
+                async with pacer:
+                    await _sleep(spacing)
+            try:
+                results[index] = await task
+            except Exception as e:
+                results[index] = e
+
+    # TaskGroup instead of gather: no per-call argument tuple or future
+    # bundling, and cancellation tears the whole group down cleanly.
+    # Failures are captured per slot above, matching return_exceptions.
+    async with asyncio.TaskGroup() as tg:
+        for i, task in enumerate(tasks):
+            tg.create_task(run(i, task))
+
+    return results
+
+
+def _retry_delays(
+    max_attempts: int,
+    delay: float,
+    backoff: float,
+    max_delay: float,
+) -> List[float]:
+    """Precompute the capped exponential backoff schedule.
+
+    The schedule is deterministic per decoration, so it is built once
+    instead of re-deriving delay * backoff**attempt on every failure;
+    only the jitter stays per-call. The cap keeps later attempts from
+    sleeping unboundedly long.
+    """
+    return [min(max_delay, delay * backoff ** i) for i in range(max_attempts - 1)]
+
+
+def batch_execute_sync(
+    fns: List[Callable[[], Any]],
+    max_workers: int = 10,
+    delay_between_batches: float = 0.1,
+) -> List[Any]:
     """
-    results = []
+    Execute callables in batches on a shared thread pool.
 
-    for i in range(0, len(tasks), batch_size):
-        batch = tasks[i:i + batch_size]
-        batch_results = await asyncio.gather(*batch, return_exceptions=True)
-        results.extend(batch_results)
+    Synchronous counterpart of batch_execute for blocking I/O: one
+    ThreadPoolExecutor serves the whole run (spawning a pool per batch
+    would re-pay thread startup each time), chunks of max_workers run
+    concurrently, and exceptions are returned in place like
+    return_exceptions=True.
 
-        # Add delay between batches (except for the last batch)
-        if i + batch_size < len(tasks):
-            await asyncio.sleep(delay_between_batches)
+    Args:
+        fns: List of zero-argument callables
+        max_workers: Number of callables to execute concurrently
+        delay_between_batches: Delay between chunks in seconds
+
+    Returns:
+        List of results in input order (exceptions in place)
+    """
+    results: List[Any] = [None] * len(fns)
+    total = len(fns)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for offset in range(0, total, max_workers):
+            futures = [
+                executor.submit(fn) for fn in fns[offset:offset + max_workers]
+            ]
+            for i, future in enumerate(futures):
+                try:
+                    results[offset + i] = future.result()
+                except Exception as e:
+                    results[offset + i] = e
+
+            if delay_between_batches > 0 and offset + max_workers < total:
+                time.sleep(delay_between_batches)
 
     return results
 
@@ -293,75 +542,121 @@ def retry_on_failure(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> Callable:
     """
     Decorator to retry function calls on failure.
 
+    Retries back off exponentially from `delay`, capped at `max_delay`,
+    with +/-`jitter` (as a fraction) of randomization per sleep.
+    Cancellation is never retried.
+
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound on a single retry sleep
+        jitter: Random spread applied to each sleep (0 disables)
 
     Returns:
         Decorated function
     """
+    # Branch on the function kind once, at decoration time: only the
+    # wrapper that will actually run is allocated, and its no-exception
+    # path is just the call itself — retry bookkeeping lives entirely
+    # in the except clause.
     def decorator(func: Callable) -> Callable:
-        async def async_wrapper(*args, **kwargs):
-            current_delay = delay
-            last_exception = None
-
-            for attempt in range(max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}"
-                        )
-
-            raise last_exception
-
-        def sync_wrapper(*args, **kwargs):
-            import time
-            current_delay = delay
-            last_exception = None
-
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}"
-                        )
-
-            raise last_exception
-
+        # The base schedule is fixed by the parameters, so it is
+        # computed once here and closed over; wrappers index into it
+        delays = _retry_delays(max_attempts, delay, backoff, max_delay)
         if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+            return _build_async_retry(func, max_attempts, delays, exceptions, jitter)
+        return _build_sync_retry(func, max_attempts, delays, exceptions, jitter)
 
     return decorator
 
 
+def _build_async_retry(
+    func: Callable,
+    max_attempts: int,
+    delays: List[float],
+    exceptions: tuple,
+    jitter: float,
+) -> Callable:
+    """Build the retry wrapper for a coroutine function."""
+    async def async_wrapper(*args, **kwargs):
+        last_exception = None
+
+        for attempt in range(max_attempts):
+            try:
+                return await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                # Cancellation is a control signal, not a failure
+                raise
+            except exceptions as e:
+                last_exception = e
+                if attempt < max_attempts - 1:
+                    sleep_time = delays[attempt]
+                    if jitter:
+                        sleep_time *= 1 + random.uniform(-jitter, jitter)
+                    logger.warning(
+                        f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
+                        f"Retrying in {sleep_time:.2f}s..."
+                    )
+                    await asyncio.sleep(sleep_time)
+                else:
+                    logger.error(
+                        f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}"
+                    )
+
+        raise last_exception
+
+    return async_wrapper
+
+
+def _build_sync_retry(
+    func: Callable,
+    max_attempts: int,
+    delays: List[float],
+    exceptions: tuple,
+    jitter: float,
+) -> Callable:
+    """Build the retry wrapper for a plain function."""
+    def sync_wrapper(*args, **kwargs):
+        last_exception = None
+
+        for attempt in range(max_attempts):
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
+                if attempt < max_attempts - 1:
+                    sleep_time = delays[attempt]
+                    if jitter:
+                        sleep_time *= 1 + random.uniform(-jitter, jitter)
+                    logger.warning(
+                        f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
+                        f"Retrying in {sleep_time:.2f}s..."
+                    )
+                    time.sleep(sleep_time)
+                else:
+                    logger.error(
+                        f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}"
+                    )
+
+        raise last_exception
+
+    return sync_wrapper
+
+
+# Directories already ensured by export_dashboard_json in this
+# process: a batch export into one directory pays the stat+mkdir
+# syscalls once instead of per file. Set ops are GIL-atomic.
+_ENSURED_DIRS: set = set()
+
+
 def export_dashboard_json(
     dashboard_data: Dict[str, Any],
     file_path: Union[str, Path],
@@ -375,10 +670,22 @@ def export_dashboard_json(
         file_path: Output file path
         pretty: Whether to format JSON prettily
     """
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(file_path, "w", encoding="utf-8") as f:
+    # os.fspath/os.path are thin C wrappers; wrapping the argument in a
+    # Path object only to take .parent back out of it re-parses the
+    # string and allocates for nothing on hot export loops
+    path = os.fspath(file_path)
+    parent = os.path.dirname(path)
+    if parent and parent not in _ENSURED_DIRS:
+        os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if pretty else 0
+        with open(path, "wb") as f:
+            f.write(_orjson.dumps(dashboard_data, option=option))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
         if pretty:
             json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
         else:
@@ -397,10 +704,16 @@ def load_dashboard_json(
     Returns:
         Dashboard data
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Dashboard file not found: {file_path}")
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
\ No newline at end of file
+    # No exists() precheck: open() raises FileNotFoundError itself, so
+    # the separate stat syscall only duplicated the kernel's check
+    path = os.fspath(file_path)
+
+    try:
+        if _orjson is not None:
+            with open(path, "rb") as f:
+                return _orjson.loads(f.read())
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Dashboard file not found: {path}") from None
\ No newline at end of file